@@ -92,7 +92,7 @@ def browse_connections(state: AgentState) -> AgentState:
 
     linkedin = LinkedInHandler(state["browser"])
     linkedin.go_to_connections_page()
-    profiles = linkedin.extract_connections()
+    profiles = list(linkedin.extract_connections())
 
     state["urls_to_process"] = profiles
     state["action"] = "analyze_profile"
@@ -106,7 +106,7 @@ def search_profiles(state: AgentState) -> AgentState:
     query = state.get("query")
     linkedin = LinkedInHandler(state["browser"])
     print(f'query is {query}')
-    profiles = linkedin.search_profiles(query)
+    profiles = list(linkedin.search_profiles(query))
 
     state["urls_to_process"] = profiles
     state["action"] = "analyze_profile"
@@ -2,6 +2,7 @@
 Browser management module for SeedPitcher.
 """
 
+import atexit
 import logging
 import threading
 import os
@@ -23,6 +24,10 @@ except ImportError:
 _server_thread = None
 _server_port = 5050
 
+# Browser shared by callers that don't bring their own
+_shared_browser = None
+_shared_browser_lock = threading.Lock()
+
 def start_browser_server(port: int = 5050) -> bool:
     """Start the browser server on a specified port.
     
@@ -87,3 +92,20 @@ def get_browser(use_http_client: bool = False, http_port: Optional[int] = None)
         # Use direct browser access
         logger.info("Using direct browser access (PlaywrightBrowser)")
         return PlaywrightBrowser()
+
+def get_shared_browser() -> object:
+    """Get the process-wide browser instance, launching it on first use.
+
+    Reusing one browser avoids paying the Chrome start-up cost for every
+    caller. The browser is closed automatically when the interpreter exits.
+
+    Returns:
+        A browser instance for web automation.
+    """
+    global _shared_browser
+
+    with _shared_browser_lock:
+        if _shared_browser is None:
+            _shared_browser = get_browser()
+            atexit.register(_shared_browser.close)
+        return _shared_browser
@@ -94,6 +94,14 @@ class HTTPBrowserClient:
             logger.error(f"Error finding element with selector {selector}: {str(e)}")
             return None
 
+    def query(self, selector: str) -> Optional[Dict]:
+        """Return the first element matching a CSS selector, or None.
+
+        The browser server only searches the whole page, so unlike the other
+        backends there is no root argument and no query_all for scoped lookups.
+        """
+        return self.find_element(selector)
+
     def find_elements(self, selector: str, by: str = "css") -> List[Dict]:
         """Find elements on the page."""
         try:
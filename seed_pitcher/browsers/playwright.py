@@ -1,9 +1,38 @@
 """Integration with Playwright for browser automation."""
 
+import json
+import os
 import time
 from typing import List, Dict, Any, Optional
 import seed_pitcher.config as config
 
+# URL patterns for images, media, fonts and trackers, which the automation never
+# reads. They are blocked in the browser over CDP, so no request waits on
+# Python. Stylesheets are kept because element visibility checks depend on them.
+BLOCKED_URL_PATTERNS = (
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.mp4",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    # LinkedIn serves profile and feed images without a file extension
+    "*media.licdn.com/dms/image/*",
+    # Ad and analytics hosts LinkedIn pages load; nothing we read depends on them
+    "*ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+)
+
+# Cookies and local storage of a launched browser, restored on the next launch
+# so LinkedIn doesn't need a fresh login and warm-up every run
+STORAGE_STATE_FILE = config.CONFIG_DIR / "playwright_state.json"
 
 class PlaywrightBrowser:
     """Wrapper for Playwright browser."""
@@ -14,6 +43,8 @@ class PlaywrightBrowser:
         self.browser = None
         self.context = None
         self.page = None
+        self._resources_blocked = False
+        self._launched = False
 
         try:
             # First check if playwright is installed
@@ -69,10 +100,17 @@ class PlaywrightBrowser:
                     args=browser_args,
                 )
 
-                # Create a context with specific viewport size
+                # Create a context with specific viewport size, restoring the
+                # session saved by the previous run if there is one
                 self.context = self.browser.new_context(
-                    viewport={"width": 1920, "height": 1080}
+                    viewport={"width": 1920, "height": 1080},
+                    storage_state=(
+                        str(STORAGE_STATE_FILE)
+                        if STORAGE_STATE_FILE.exists()
+                        else None
+                    ),
                 )
+                self._launched = True
 
                 self.page = self.context.new_page()
 
@@ -111,6 +149,42 @@ class PlaywrightBrowser:
             pass
             print(f"Error navigating to {url}: {str(e)}")
 
+    def block_resources(self, url_patterns=BLOCKED_URL_PATTERNS, page=None) -> None:
+        """Block requests matching the given URL patterns on the automation page.
+
+        Args:
+            url_patterns: CDP Network.setBlockedURLs patterns to block
+            page: Extra tab to block them on instead of the automation page
+        """
+        target = page or self.page
+        if not target:
+            print("Cannot block resources: browser not initialized")
+            return
+
+        if page is None and self._resources_blocked:
+            return
+
+        try:
+            # The browser drops these itself; a catch-all route would pause
+            # every request until Python next calls into Playwright
+            cdp = target.context.new_cdp_session(target)
+            cdp.send("Network.enable")
+            cdp.send("Network.setBlockedURLs", {"urls": list(url_patterns)})
+            if page is None:
+                self._resources_blocked = True
+        except Exception as e:
+            print(f"Error blocking resources: {str(e)}")
+
+    def _pause(self, ms: int) -> None:
+        """Wait for ms milliseconds while still serving Playwright's event loop.
+
+        Unlike time.sleep, page events and route handlers keep running.
+        """
+        try:
+            self.page.wait_for_timeout(ms)
+        except Exception:
+            time.sleep(ms / 1000)
+
     def get_page_source(self) -> str:
         """Get the current page source."""
         if not self.page:
@@ -141,6 +215,33 @@ class PlaywrightBrowser:
             print(f"Error finding element {selector}: {str(e)}")
             return None
 
+    def query(self, selector: str, root: Any = None) -> Any:
+        """Return the first element matching a CSS selector, or None.
+
+        Unlike find_element, the search can be scoped to a parent element.
+        """
+        if not self.page:
+            print("Cannot query: browser not initialized")
+            return None
+
+        try:
+            return (root or self.page).query_selector(selector)
+        except Exception as e:
+            print(f"Error querying {selector}: {str(e)}")
+            return None
+
+    def query_all(self, selector: str, root: Any = None) -> List[Any]:
+        """Return all elements matching a CSS selector, optionally under root."""
+        if not self.page:
+            print("Cannot query: browser not initialized")
+            return []
+
+        try:
+            return (root or self.page).query_selector_all(selector)
+        except Exception as e:
+            print(f"Error querying {selector}: {str(e)}")
+            return []
+
     def find_elements(self, selector: str, by: str = "css") -> List[Any]:
         """Find elements on the page."""
         if not self.page:
@@ -332,7 +433,7 @@ class PlaywrightBrowser:
                 )
 
                 # Wait for element to be stable
-                time.sleep(1)
+                self._pause(1000)
 
                 if attempt == 0:
                     # First try: standard click with longer timeout
@@ -350,12 +451,12 @@ class PlaywrightBrowser:
 
                 # If we get here, click was successful
                 logger.info("Click successful")
-                time.sleep(2)  # Wait longer for action to complete
+                self._pause(2000)  # Wait longer for action to complete
                 return
 
             except Exception as e:
                 logger.warning(f"Click attempt {attempt + 1} failed: {str(e)}")
-                time.sleep(2)  # Wait before retrying
+                self._pause(2000)  # Wait before retrying
 
         # All attempts failed
         logger.error("All click methods failed")
@@ -377,7 +478,7 @@ class PlaywrightBrowser:
                 """,
                 element,
             )
-            time.sleep(2)
+            self._pause(2000)
             logger.info("Dispatch event completed")
         except Exception as e:
             logger.error(f"Final click attempt also failed: {str(e)}")
@@ -398,7 +499,7 @@ class PlaywrightBrowser:
                     # First try: clear and type
                     logger.info("Trying standard fill and type method")
                     element.fill("")  # Clear existing text
-                    time.sleep(0.5)  # Brief pause between clearing and typing
+                    self._pause(500)  # Brief pause between clearing and typing
                     element.type(
                         text, delay=5
                     )  # Type with slight delay between keypresses
@@ -406,10 +507,10 @@ class PlaywrightBrowser:
                     # Second try: focus and type
                     logger.info("Trying focus and type method")
                     element.focus()
-                    time.sleep(0.5)
+                    self._pause(500)
                     element.press("Control+A")  # Select all text
                     element.press("Delete")  # Delete selected text
-                    time.sleep(0.5)
+                    self._pause(500)
                     element.type(text, delay=10)  # Type with more delay
                 else:
                     # Third try: JavaScript approach
@@ -437,7 +538,7 @@ class PlaywrightBrowser:
 
             except Exception as e:
                 logger.warning(f"Type attempt {attempt + 1} failed: {str(e)}")
-                time.sleep(1)  # Wait before retrying
+                self._pause(1000)  # Wait before retrying
 
         # All attempts failed
         logger.error("All typing methods failed")
@@ -474,7 +575,7 @@ class PlaywrightBrowser:
 
         try:
             self.page.evaluate(f"window.scrollBy(0, {amount})")
-            time.sleep(0.5)
+            self._pause(500)
         except Exception as e:
             print(f"Error scrolling page: {str(e)}")
 
@@ -550,6 +651,25 @@ class PlaywrightBrowser:
 
     def close(self) -> None:
         """Close the browser."""
+        # Only launched browsers need their session saved; a Chrome we
+        # connected to keeps its own profile
+        if self._launched and self.context:
+            try:
+                STORAGE_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                state = self.context.storage_state()
+                # The state holds LinkedIn session cookies, so create the file
+                # private rather than tightening its permissions afterwards
+                fd = os.open(
+                    STORAGE_STATE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                )
+                with os.fdopen(fd, "w") as f:
+                    # O_CREAT's mode only applies to new files, so tighten a
+                    # file left by an older run before writing to it
+                    os.chmod(STORAGE_STATE_FILE, 0o600)
+                    json.dump(state, f)
+            except Exception as e:
+                print(f"Error saving browser session: {str(e)}")
+
         try:
             if self.browser:
                 self.browser.close()
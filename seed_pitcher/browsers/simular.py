@@ -12,6 +12,26 @@ from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger("seed_pitcher.browsers.simular")
 
+# URL patterns for images, media and fonts, which the automation never reads
+BLOCKED_URL_PATTERNS = (
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.mp4",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    # Ad and analytics hosts
+    "*ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+)
+
 class SimularBrowser:
     """Wrapper for the simular.ai browser with thread safety."""
 
@@ -43,6 +63,16 @@ class SimularBrowser:
         self.driver.get(url)
         time.sleep(2)  # Wait for page to load
 
+    def block_resources(self, url_patterns=BLOCKED_URL_PATTERNS) -> None:
+        """Block requests matching the given URL patterns via CDP."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(url_patterns)}
+            )
+        except Exception as e:
+            logger.warning(f"Could not block resources: {str(e)}")
+
     def get_page_source(self) -> str:
         """Get the current page source."""
         return self.driver.page_source
@@ -56,6 +86,18 @@ class SimularBrowser:
         else:
             raise ValueError(f"Unsupported selector type: {by}")
 
+    def query(self, selector: str, root: Any = None) -> Optional[Any]:
+        """Return the first element matching a CSS selector, or None.
+
+        Uses find_elements so that a miss does not raise.
+        """
+        elements = (root or self.driver).find_elements_by_css_selector(selector)
+        return elements[0] if elements else None
+
+    def query_all(self, selector: str, root: Any = None) -> List[Any]:
+        """Return all elements matching a CSS selector, optionally under root."""
+        return (root or self.driver).find_elements_by_css_selector(selector)
+
     def find_elements(self, selector: str, by: str = "css") -> List[Any]:
         """Find elements on the page."""
         if by == "css":
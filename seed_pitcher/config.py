@@ -9,6 +9,7 @@ INVESTOR_THRESHOLD = 0.5
 LLM_MODEL = "claude"
 BROWSER_TYPE = "playwright"
 REMOTE_DEBUGGING_PORT = 9222
+LLM_MAX_CONCURRENCY = 8  # Parallel LLM requests when drafting in batches
 FOUNDER_NAME = ""  # Will be set via command line or prompt
 
 # API keys (to be loaded from environment or config)
@@ -26,7 +27,7 @@ def update_config(config_dict: Dict[str, Any]) -> None:
     """Update global configuration with values from config file."""
     global INVESTOR_THRESHOLD, LLM_MODEL, BROWSER_TYPE, REMOTE_DEBUGGING_PORT
     global OPENAI_API_KEY, ANTHROPIC_API_KEY, DEEPSEEK_API_KEY, TAVILY_API_KEY
-    global FOUNDER_NAME
+    global FOUNDER_NAME, LLM_MAX_CONCURRENCY
 
     if "investor_threshold" in config_dict:
         INVESTOR_THRESHOLD = config_dict["investor_threshold"]
@@ -40,6 +41,9 @@ def update_config(config_dict: Dict[str, Any]) -> None:
     if "remote_debugging_port" in config_dict:
         REMOTE_DEBUGGING_PORT = config_dict["remote_debugging_port"]
 
+    if "llm_max_concurrency" in config_dict:
+        LLM_MAX_CONCURRENCY = config_dict["llm_max_concurrency"]
+
     # Load API keys from config if not in environment
     if "openai_api_key" in config_dict and not OPENAI_API_KEY:
         OPENAI_API_KEY = config_dict["openai_api_key"]
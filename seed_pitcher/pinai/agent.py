@@ -28,6 +28,13 @@ from seed_pitcher.utils.pdf import extract_text_from_pdf
 logger = logging.getLogger("seed_pitcher.pinai")
 console = Console()
 
+# Patterns for pulling details out of user chat messages
+_LINKEDIN_URL_RE = re.compile(r'(https?://(?:www\.)?linkedin\.com/\S+)')
+_PROFILE_NAME_RE = re.compile(r'(?:name is|name:|called)\s+([A-Z][a-zA-Z\s\-\']+)', re.IGNORECASE)
+_PROFILE_COMPANY_RE = re.compile(r'(?:work(?:s|ing)? (?:at|for)|company is|company:|with)\s+([A-Za-z0-9\s\-\'\&\.]+)', re.IGNORECASE)
+_THRESHOLD_RE = re.compile(r'0\.\d+')
+_FOUNDER_NAME_RE = re.compile(r'(?:to|is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+
 
 def ensure_browser_server_running():
     """
@@ -389,7 +396,7 @@ I'm now ready to analyze investor profiles. You can:
             return
         
         # Check for LinkedIn URL in the message
-        linkedin_urls = re.findall(r'(https?://(?:www\.)?linkedin\.com/\S+)', user_message)
+        linkedin_urls = _LINKEDIN_URL_RE.findall(user_message)
         
         # Debug log for URL detection
         logger.info(f"LinkedIn URLs found in message: {linkedin_urls}")
@@ -793,7 +800,7 @@ This will help me analyze if they're a good match for your startup.""")
                         
                         # Now extract info from user message to populate our result directly
                         # Extract profile name if provided by user
-                        name_match = re.search(r'(?:name is|name:|called)\s+([A-Z][a-zA-Z\s\-\']+)', user_message, re.IGNORECASE)
+                        name_match = _PROFILE_NAME_RE.search(user_message)
                         if name_match:
                             profile_name = name_match.group(1).strip()
                             if profile_name:
@@ -801,7 +808,7 @@ This will help me analyze if they're a good match for your startup.""")
                                 logger.info(f"Extracted profile name from user input: {profile_name}")
                         
                         # Extract company/title if provided
-                        company_match = re.search(r'(?:work(?:s|ing)? (?:at|for)|company is|company:|with)\s+([A-Za-z0-9\s\-\'\&\.]+)', user_message, re.IGNORECASE)
+                        company_match = _PROFILE_COMPANY_RE.search(user_message)
                         if company_match:
                             company = company_match.group(1).strip()
                             if company:
@@ -1131,7 +1138,7 @@ For now, you can upload your pitch deck to a file sharing service like Google Dr
         # Handle setting threshold
         elif "threshold" in user_message.lower() and any(x in user_message.lower() for x in ["set", "change", "update"]):
             # Try to extract a number
-            threshold_match = re.search(r'0\.\d+', user_message)
+            threshold_match = _THRESHOLD_RE.search(user_message)
             if threshold_match:
                 try:
                     new_threshold = float(threshold_match.group(0))
@@ -1155,7 +1162,7 @@ For now, you can upload your pitch deck to a file sharing service like Google Dr
         # Handle updating founder name
         elif ("name" in user_message.lower() or "founder" in user_message.lower()) and any(x in user_message.lower() for x in ["change", "update", "set"]):
             # Extract name (assume anything after "to" or after "name is")
-            name_match = re.search(r'(?:to|is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', user_message)
+            name_match = _FOUNDER_NAME_RE.search(user_message)
             if name_match:
                 founder_name = name_match.group(1).strip()
                 startup_info["founder_name"] = founder_name
@@ -0,0 +1,134 @@
+"""On-disk caches for scraped LinkedIn profiles and LLM results."""
+
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from seed_pitcher.config import CONFIG_DIR
+
+logger = logging.getLogger("seed_pitcher.cache")
+
+PROFILE_CACHE_FILE = CONFIG_DIR / "linkedin_cache.sqlite"
+PROFILE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+
+class ProfileCache:
+    """Extracted profile dicts keyed by canonical profile URL.
+
+    Each entry remembers which fields were requested when it was scraped, so
+    a cheap first-pass extraction never answers a later full one.
+    """
+
+    def __init__(self, path: Path = PROFILE_CACHE_FILE, ttl: float = PROFILE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            "url TEXT PRIMARY KEY, fields TEXT, data TEXT, scraped_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str, fields: frozenset) -> Optional[Dict[str, Any]]:
+        """Return the cached profile for url if it is fresh and covers fields."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fields, data, scraped_at FROM profiles WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        cached_fields, data, scraped_at = row
+        if time.time() - scraped_at >= self.ttl:
+            return None
+        if not fields <= frozenset(json.loads(cached_fields)):
+            return None
+        return json.loads(data)
+
+    def set(self, url: str, fields: frozenset, profile_data: Dict[str, Any]) -> None:
+        """Store a freshly extracted profile."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?)",
+                    (
+                        url,
+                        json.dumps(sorted(fields)),
+                        json.dumps(profile_data),
+                        time.time(),
+                    ),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Could not cache profile %s: %s", url, e)
+
+
+@functools.lru_cache(maxsize=None)
+def get_profile_cache(ttl: float = PROFILE_CACHE_TTL) -> ProfileCache:
+    """Process-wide ProfileCache for the given TTL, opened on first use."""
+    return ProfileCache(ttl=ttl)
+
+
+LLM_CACHE_FILE = CONFIG_DIR / "llm_cache.sqlite"
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+
+def llm_cache_key(llm: Any, *parts: Any) -> str:
+    """Key for an LLM output: the model plus everything that went into the prompt."""
+    model = (
+        getattr(llm, "model_name", None)
+        or getattr(llm, "model", None)
+        or type(llm).__name__
+    )
+    payload = json.dumps([model, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """JSON-serializable LLM results keyed by llm_cache_key, kept across runs."""
+
+    def __init__(self, path: Path = LLM_CACHE_FILE, ttl: float = LLM_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key if it is still fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a result."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Could not cache LLM result: %s", e)
+
+
+@functools.lru_cache(maxsize=None)
+def get_llm_cache() -> LLMCache:
+    """Process-wide LLMCache, opened on first use."""
+    return LLMCache()
@@ -1,15 +1,19 @@
 """Investor analysis and scoring utilities."""
 
-from typing import Dict, Any, List
-from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from typing import TYPE_CHECKING, Dict, Any, List
+
+# langchain is slow to import; only load it when an LLM is actually used
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 
 def analyze_investor_profile(
-    profile_data: Dict[str, Any], llm: BaseChatModel
+    profile_data: Dict[str, Any], llm: "BaseChatModel"
 ) -> Dict[str, Any]:
     """Analyze LinkedIn profile to determine if it's an investor."""
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import JsonOutputParser
+
     # Create prompt template
     template = """
     You are an expert in analyzing LinkedIn profiles to identify investors.
@@ -1,148 +1,437 @@
 """LinkedIn interaction utilities."""
 
+import functools
+import logging
+import re
 import time
-from typing import List, Dict, Any
-from urllib.parse import urlparse, urlunparse
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from urllib.parse import quote, urlsplit
+from seed_pitcher.browsers import get_shared_browser
+from seed_pitcher.browsers.simular import SimularBrowser
+from seed_pitcher.utils.cache import PROFILE_CACHE_TTL, get_profile_cache
 from seed_pitcher.browsers.debug_utils import print_all_links, find_elements_containing_url_pattern, examine_linkedin_search_results
 
+logger = logging.getLogger("seed_pitcher.linkedin")
+
+# Selector fallbacks, tried in order. LinkedIn changes its markup frequently,
+# so each field keeps several candidates.
+_NAME_SELECTORS = (
+    "h1.text-heading-xlarge",
+    "h1.inline",
+    "h1.text-heading-large",
+)
+_HEADLINE_SELECTORS = ("div.text-body-medium",)
+_LOCATION_SELECTORS = ("span.text-body-small[aria-hidden='true']",)
+_ABOUT_SELECTORS = ("div.display-flex.ph5.pv3 > div.pv-shared-text-with-see-more",)
+_EXPERIENCE_SECTION_SELECTORS = (
+    "section#experience-section",
+    "section.experience-section",
+    "div.experience-section",
+    "#experience",
+)
+_EXPERIENCE_ITEM_SELECTORS = (
+    "li.pv-entity__position-group-pager",
+    "li.pvs-list__item--line-separated",
+    "div.pvs-entity",
+)
+_TITLE_SELECTORS = (
+    "h3.t-16",
+    "span.t-16",
+    "span.mr1 span",
+    "span.mr1",
+)
+_COMPANY_SELECTORS = (
+    "p.pv-entity__secondary-title",
+    "span.t-14",
+    "span.t-normal",
+)
+_EDUCATION_SECTION_SELECTORS = (
+    "section#education-section",
+    "section.education-section",
+    "div.education-section",
+    "#education",
+)
+_EDUCATION_ITEM_SELECTORS = (
+    "li.pv-education-entity",
+    "li.pvs-list__item--line-separated",
+    "div.pvs-entity",
+)
+_SCHOOL_SELECTORS = (
+    "h3.pv-entity__school-name",
+    "span.t-16",
+    "span.mr1 span",
+    "span.mr1",
+)
+_DEGREE_SELECTORS = (
+    "p.pv-entity__degree-name span.pv-entity__comma-item",
+    "span.t-14",
+    "span.t-normal",
+)
+# Message-button selectors in tiers, most precise first. The lookup returns
+# the first match from the precise tier, then from the generic profile action
+# buttons, and only then a button or link in the page body labelled "Message".
+_MESSAGE_BUTTON_PRECISE_SELECTORS = (
+    "button[aria-label='Message']",
+    "button.message-anywhere-button",
+    "a.message-anywhere-button",
+    "button.pv-s-profile-actions--message",
+    "a[data-control-name='message']",
+)
+_MESSAGE_BUTTON_GENERIC_SELECTORS = (
+    "button.pvs-profile-actions__action.artdeco-button",
+    "button.pvs-profile-actions__action",
+    "button.artdeco-button.artdeco-button--2.artdeco-button--primary",
+    "button.artdeco-button--primary",
+)
+# Inline login forms LinkedIn shows instead of the page when rate limiting
+_LOGIN_WALL_SELECTOR = "input[name='session_key'], form.login__form"
+_MESSAGE_INPUT_SELECTORS = ("div[role=textbox]",)
+_MESSAGE_INPUT_SELECTOR = ", ".join(_MESSAGE_INPUT_SELECTORS)
+_SEND_BUTTON_SELECTORS = (
+    "button.msg-form__send-button",
+    "button[type='submit']",
+    "button.artdeco-button--primary",
+)
+_MESSAGE_HISTORY_SELECTORS = (
+    ".msg-s-message-list__event",
+    ".msg-s-message-list-content",
+    ".msg-s-message-group__meta",
+)
+# Distinct non-empty text of every element matching each history selector, in
+# order. The selectors overlap (an event sits inside the list content), so the
+# same text is kept only once.
+_MESSAGE_HISTORY_JS = """
+(selectors) => Array.from(new Set(selectors
+    .flatMap(s => Array.from(document.querySelectorAll(s), e => (e.innerText || '').trim()))
+    .filter(Boolean)))
+"""
+
+# The message-button fallbacks as one selector group, so a single query
+# returns the first match in document order. It must stay plain CSS for
+# backends without page scripting, so the text tier is left out.
+_MESSAGE_BUTTON_SELECTOR = ", ".join(
+    _MESSAGE_BUTTON_PRECISE_SELECTORS + _MESSAGE_BUTTON_GENERIC_SELECTORS
+)
+
+# Finds the message button in one round-trip, walking the tiers in order.
+# :has-text is Playwright-only, so the text tier is a scan of button and link
+# text instead. It is limited to main and to labels starting with "Message",
+# so the nav bar's "Messaging" link (which opens /messaging/) never matches.
+_MESSAGE_BUTTON_JS = """
+([precise, generic]) => {
+    const first = (selectors) => {
+        for (const s of selectors) {
+            const el = document.querySelector(s);
+            if (el) return el;
+        }
+        return null;
+    };
+    return first(precise)
+        || first(generic)
+        || Array.from(document.querySelectorAll('main button, main a'))
+            .find(e => /^\\s*message\\b/i.test(e.innerText)
+                && !(e.getAttribute('href') || '').includes('/messaging/'));
+}
+"""
+
+# Extracts every profile field in a single browser round-trip. Fallback
+# selectors are tried in order, and sections whose selector list is empty
+# are skipped.
+_PROFILE_JS = """
+(sel) => {
+    const firstText = (root, selectors) => {
+        for (const s of selectors) {
+            const el = root.querySelector(s);
+            const text = el ? el.innerText.trim() : "";
+            if (text) return text;
+        }
+        return "";
+    };
+    const sectionItems = (sectionSelectors, itemSelectors, limit) => {
+        const section = sectionSelectors.length
+            ? document.querySelector(sectionSelectors.join(", "))
+            : null;
+        if (!section) return [];
+        for (const s of itemSelectors) {
+            const items = section.querySelectorAll(s);
+            if (items.length) return Array.from(items).slice(0, limit);
+        }
+        return [];
+    };
+    if (document.querySelector(sel.loginWall)) return {loginWall: true};
+    return {
+        name: firstText(document, sel.name),
+        headline: firstText(document, sel.headline),
+        location: firstText(document, sel.location),
+        about: firstText(document, sel.about),
+        experience: sectionItems(sel.experienceSection, sel.experienceItem, 3)
+            .map(el => ({
+                title: firstText(el, sel.title),
+                company: firstText(el, sel.company),
+            }))
+            .filter(e => e.title || e.company),
+        education: sectionItems(sel.educationSection, sel.educationItem, 2)
+            .map(el => ({
+                school: firstText(el, sel.school),
+                degree: firstText(el, sel.degree),
+            }))
+            .filter(e => e.school || e.degree),
+    };
+}
+"""
+
+# Company names matching this are treated as investment funds
+_FUND_RE = re.compile(
+    r"\b(?:capital|ventures|partners|funds?|vc|equity)\b", re.IGNORECASE
+)
+
+# Collect every profile link's href in a single browser round-trip. The
+# class and tag collections skip the selector parser, which matters on a
+# connections page with thousands of cards.
+_CONNECTION_HREFS_JS = """
+() => Array.from(
+    document.getElementsByClassName('mn-connection-card__link'),
+    a => a.href
+)
+"""
+_SEARCH_RESULT_HREFS_JS = """
+() => Array.from(document.getElementsByTagName('a'), a => a.href)
+    .filter(href => href.includes('/in/'))
+"""
+
+_LINKEDIN_URL = "https://www.linkedin.com"
+
+# Landing on a URL matching this after navigating means LinkedIn wants a login
+_LOGIN_URL_RE = re.compile(r"login|auth|sign-in", re.IGNORECASE)
+
+# Every field extract_profile can fill in
+FULL_PROFILE_FIELDS = frozenset(
+    (
+        "name",
+        "headline",
+        "company",
+        "location",
+        "about",
+        "experience",
+        "education",
+        "fund",
+    )
+)
+
+
+def _normalize_profile_url(href: str) -> Optional[str]:
+    """Reduce a profile link to its canonical form, or None if it isn't one."""
+    if not href or "/in/" not in href:
+        return None
+    slug = href.split("/in/", 1)[1].split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+    return f"{_LINKEDIN_URL}/in/{slug}" if slug else None
+
+
+def _normalize_for_compare(url: str) -> str:
+    """Reduce a URL to what identifies the page: no query, fragment or trailing /."""
+    return urlsplit(url)._replace(query="", fragment="").geturl().rstrip("/").lower()
+
 
 class LinkedInHandler:
     """Handler for LinkedIn operations."""
 
-    def __init__(self, browser):
-        """Initialize with a browser instance."""
+    def __init__(self, browser=None, cache_ttl: float = PROFILE_CACHE_TTL):
+        """Initialize with a browser instance.
+
+        Without one, the process-wide shared browser is used so that batch
+        runs don't launch Chrome for every handler. Extracted profiles are
+        cached on disk for cache_ttl seconds; pass 0 to always re-scrape.
+        """
+        if browser is None:
+            browser = get_shared_browser()
         self.browser = browser
-        self.base_url = "https://www.linkedin.com"
+        self.base_url = _LINKEDIN_URL
+        self._cache = get_profile_cache(cache_ttl) if cache_ttl else None
+        # (page URL, handle) of the last message button found, so checking the
+        # history and then sending on the same profile only looks it up once
+        self._message_button = None
+
+        # Images, media and fonts are never read, so don't download them
+        block_resources = getattr(browser, "block_resources", None)
+        if block_resources:
+            block_resources()
 
     def go_to_connections_page(self) -> None:
         """Navigate to the LinkedIn connections page."""
         connections_url = f"{self.base_url}/mynetwork/invite-connect/connections/"
         self.browser.navigate(connections_url)
 
-        # Wait for the page to load
-        time.sleep(3)
-
-        # Check if we're logged in, connections page should have a specific element
-        connections_header = self.browser.find_element("h1.t-18")
-        if not connections_header or "Connections" not in self.browser.get_text(
-            connections_header
-        ):
+        # Wait for the header; if we're logged in the connections page has it.
+        # Some backends only report whether it appeared, so look it up again
+        # to read its text.
+        self._wait_for_element("h1.t-18", timeout=10000)
+        connections_header = self._safe_query("h1.t-18")
+        if "Connections" not in self._safe_get_text(connections_header):
             raise Exception(
                 "Not logged in to LinkedIn or connections page couldn't load"
             )
 
-    def extract_connections(self, max_pages: int = 5) -> List[str]:
-        """Extract connection profiles from the connections page."""
-        profile_urls = []
+    def extract_connections(self, max_pages: int = 5) -> Iterator[str]:
+        """Extract connection profiles from the connections page.
 
-        for page in range(max_pages):
-            # Find all connection elements
-            connection_cards = self.browser.find_elements(".mn-connection-card")
+        Profile URLs are yielded as soon as each page is scraped, so callers
+        can start processing them while further pages are still loading.
+        Each profile is yielded once, even though every page re-lists the
+        cards loaded before it.
+        """
+        seen = set()
 
-            for card in connection_cards:
-                try:
-                    # Extract profile link
-                    profile_link = self.browser.find_element(
-                        ".mn-connection-card__link", card
-                    )
-                    href = self.browser.get_attribute(profile_link, "href")
-
-                    # Normalize URL
-                    parsed_url = urlparse(href)
-                    clean_path = "/".join(
-                        parsed_url.path.split("/")[:3]
-                    )  # Keep only /in/username part
-                    normalized_url = urlunparse(
-                        (parsed_url.scheme, parsed_url.netloc, clean_path, "", "", "")
-                    )
+        for page in range(max_pages):
+            # Extract the profile link of every connection card
+            hrefs = self._collect_hrefs(
+                _CONNECTION_HREFS_JS, ".mn-connection-card__link"
+            )
 
-                    profile_urls.append(normalized_url)
-                except:
-                    continue
+            for href in hrefs:
+                normalized_url = _normalize_profile_url(href)
+                if normalized_url and normalized_url not in seen:
+                    seen.add(normalized_url)
+                    yield normalized_url
 
             # Scroll to load more
             self.browser.scroll(1000)
-            time.sleep(2)
+            self._wait_for_connection_cards(len(hrefs), timeout=2000)
 
             # Check if "Show more" button exists and click it
-            try:
-                show_more = self.browser.find_element(
-                    "button.scaffold-finite-scroll__load-button"
-                )
-                if show_more:
-                    self.browser.click(show_more)
-                    time.sleep(3)
-                else:
-                    # No more connections to load
-                    break
-            except:
+            show_more = self.browser.query("button.scaffold-finite-scroll__load-button")
+            if not show_more:
                 # No show more button, probably reached the end
                 break
 
-        return profile_urls
+            try:
+                self.browser.click(show_more)
+            except Exception:
+                break
+            self._wait_for_connection_cards(len(hrefs), timeout=3000)
+
+    def _collect_hrefs(self, script: str, selector: str) -> List[str]:
+        """Hrefs of the links matching selector, in one script call where possible.
 
-    def search_profiles(self, query: str, max_pages: int = 1) -> List[str]:
-        """Search for profiles on LinkedIn."""
-        # Encode query for URL
-        from urllib.parse import quote
+        script must return the same hrefs as the selector lookup; backends
+        without execute_script read each link's href attribute instead.
+        """
+        execute_script = getattr(self.browser, "execute_script", None)
+        if execute_script is not None:
+            return execute_script(script) or []
 
+        hrefs = []
+        for link in self.browser.find_elements(selector):
+            try:
+                href = self.browser.get_attribute(link, "href")
+            except Exception:
+                continue
+            if href:
+                hrefs.append(href)
+        return hrefs
+
+    def _wait_for_connection_cards(self, previous_count: int, timeout: int) -> None:
+        """Wait until more than previous_count connection cards are on the page."""
+        page = getattr(self.browser, "page", None)
+        if page is None:
+            # Without a page to watch, give new cards the whole timeout to load
+            time.sleep(timeout / 1000)
+            return
+
+        try:
+            page.wait_for_function(
+                "n => document.getElementsByClassName('mn-connection-card').length > n",
+                arg=previous_count,
+                timeout=timeout,
+            )
+        except Exception:
+            # Nothing new loaded in time; the caller decides whether to go on
+            logger.info("No new connection cards appeared")
+
+    def search_profiles(self, query: str, max_pages: int = 1) -> Iterator[str]:
+        """Search for profiles on LinkedIn, yielding profile URLs as they are found."""
+        # Encode query for URL
         encoded_query = quote(query)
-        print(f'encoded query is {encoded_query}')
         # Navigate to search results
         search_url = f"{self.base_url}/search/results/people/?keywords={encoded_query}"
-        self.browser.navigate(search_url)
-        time.sleep(3)
 
-        profile_urls = []
+        seen = set()
 
         for page in range(max_pages):
-            # Find all search result elements
-            print(f"page entered {page}")
-            result_cards = self.browser.find_elements(
-                "a[href*='/in/']"
+            self.browser.navigate(
+                search_url if page == 0 else f"{search_url}&page={page + 1}"
             )
+            self._wait_for_search_results(timeout=10000)
+
+            # Find all search result links
+            hrefs = self._collect_hrefs(_SEARCH_RESULT_HREFS_JS, "a[href*='/in/']")
 
-            for result_card in result_cards:
-                href = self.browser.get_attribute(result_card, "href")
-                profile_urls.append(href)
-        with open("output.txt", "w") as f:
-            f.write(f"Found {(profile_urls)} profiles")
-        return profile_urls
+            found_new = False
+            for href in hrefs:
+                normalized_url = _normalize_profile_url(href)
+                if normalized_url and normalized_url not in seen:
+                    seen.add(normalized_url)
+                    found_new = True
+                    yield normalized_url
+
+            # A page without new profiles means we've run out of results
+            if not found_new:
+                break
+
+        logger.debug("Found %d profiles", len(seen))
+
+    def _wait_for_search_results(self, timeout: int) -> None:
+        """Wait until the search results list links to a profile."""
+        page = getattr(self.browser, "page", None)
+        if page is None:
+            # Without a page to watch, give the results a fixed time to load
+            time.sleep(3)
+            return
+
+        try:
+            # Scoped to main so the nav bar's link to our own profile doesn't count
+            page.wait_for_selector(
+                "main a[href*='/in/']", state="attached", timeout=timeout
+            )
+        except Exception:
+            logger.info("No search results appeared")
 
     def _safe_navigate(
         self, url: str, timeout: int = 60000, retry_count: int = 2
     ) -> bool:
         """Safely navigate to a URL with timeouts and retries."""
-        import logging
-        import time
-
-        logger = logging.getLogger("seed_pitcher")
-
         logger.info(f"Navigating to {url} with {timeout}ms timeout")
 
+        # Backends without a Playwright page can only navigate; the URL checks
+        # and load waits below need one
+        page = getattr(self.browser, "page", None)
+
         # Check if we're already on the same page to avoid unnecessary navigation
-        try:
-            current_url = self.browser.page.url
-            if (
-                current_url
-                and url
-                and current_url.split("?")[0].lower() == url.split("?")[0].lower()
-            ):
-                logger.info(f"Already on the requested URL: {current_url}")
-                return True
-        except Exception as e:
-            logger.warning(f"Error checking current URL: {str(e)}")
+        if page is not None:
+            try:
+                current_url = page.url
+                if (
+                    current_url
+                    and url
+                    and _normalize_for_compare(current_url)
+                    == _normalize_for_compare(url)
+                ):
+                    logger.info(f"Already on the requested URL: {current_url}")
+                    return True
+            except Exception as e:
+                logger.warning(f"Error checking current URL: {str(e)}")
 
         # Flag to track if page content has started loading
         page_loading_started = False
+        self._message_button = None
 
         for attempt in range(retry_count + 1):
             try:
                 # Increase the timeout for slow connections
-                try:
-                    self.browser.page.set_default_navigation_timeout(timeout)
-                except Exception as e:
-                    logger.warning(f"Could not set timeout: {str(e)}")
+                if page is not None:
+                    try:
+                        page.set_default_navigation_timeout(timeout)
+                    except Exception as e:
+                        logger.warning(f"Could not set timeout: {str(e)}")
 
                 # Navigate to the URL
                 logger.info(f"Attempt {attempt + 1}: Navigating to {url}")
@@ -160,29 +449,31 @@ class LinkedInHandler:
                         # If it's another type of error or the page hasn't started loading, re-raise
                         raise nav_error
 
-                # Wait for the page to load more completely
-                wait_time = 3 + attempt * 2  # Increase wait time with each retry
-                logger.info(
-                    f"Navigation successful, waiting {wait_time}s for page to load"
-                )
-                time.sleep(wait_time)
+                if page is not None:
+                    # Wait until the page is usable instead of sleeping for the
+                    # worst case. The navigation itself succeeded, so a slow
+                    # page is not a reason to navigate again.
+                    logger.info("Navigation successful, waiting for page content")
+                    try:
+                        page.wait_for_load_state("domcontentloaded", timeout=timeout)
+                        page.wait_for_selector(
+                            "h1, main", timeout=timeout, state="attached"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Page content did not appear in time: {str(e)}")
 
-                # Check if we were redirected to a login page
-                try:
-                    current_url = self.browser.page.url
-                    login_indicators = ["login", "auth", "sign-in"]
-
-                    if any(
-                        indicator in current_url.lower()
-                        for indicator in login_indicators
-                    ):
-                        logger.error(f"Redirected to login page: {current_url}")
-                        return False
-                except Exception as e:
-                    logger.warning(
-                        f"Could not check current URL after navigation: {str(e)}"
-                    )
-                    # Continue anyway as we might be on the right page
+                    # Check if we were redirected to a login page
+                    try:
+                        current_url = page.url
+
+                        if _LOGIN_URL_RE.search(current_url):
+                            logger.error(f"Redirected to login page: {current_url}")
+                            return False
+                    except Exception as e:
+                        logger.warning(
+                            f"Could not check current URL after navigation: {str(e)}"
+                        )
+                        # Continue anyway as we might be on the right page
 
                 # Success! We got here without exceptions
                 logger.info(f"Successfully navigated to {url}")
@@ -196,7 +487,8 @@ class LinkedInHandler:
                     # Increase timeout for next attempt
                     timeout += 30000  # Add 30s each retry
                     logger.info(f"Retrying with {timeout}ms timeout")
-                    time.sleep(3)  # Longer wait before retry
+                    # Back off briefly, doubling each time (0.2s, 0.4s, ...)
+                    time.sleep(0.2 * (2**attempt))
                 else:
                     # If page started loading but we got errors, we might be able to continue
                     if page_loading_started:
@@ -214,10 +506,6 @@ class LinkedInHandler:
 
     def _safe_get_text(self, element) -> str:
         """Safely extract text from an element, handling JSHandle@node errors."""
-        import logging
-
-        logger = logging.getLogger("seed_pitcher")
-
         if element is None:
             return ""
 
@@ -233,16 +521,13 @@ class LinkedInHandler:
 
     def _safe_find_elements(self, selector, parent=None) -> list:
         """Safely find elements, handling JSHandle@node errors."""
-        import logging
-
-        logger = logging.getLogger("seed_pitcher")
+        query_all = getattr(self.browser, "query_all", None)
+        if query_all is None:
+            # The HTTP browser client can't search inside an element
+            return []
 
         try:
-            elements = []
-            if parent is None:
-                elements = self.browser.find_elements(selector)
-            else:
-                elements = self.browser.find_elements(selector, parent)
+            elements = query_all(selector, parent)
 
             # Filter out any non-element objects
             valid_elements = []
@@ -255,12 +540,24 @@ class LinkedInHandler:
             logger.warning(f"Error finding elements with selector {selector}: {str(e)}")
             return []
 
-    def extract_profile(self, url: str) -> Dict[str, Any]:
-        """Extract information from a LinkedIn profile."""
-        import logging
-
-        logger = logging.getLogger("seed_pitcher")
+    def extract_profile(
+        self, url: str, fields: Iterable[str] = FULL_PROFILE_FIELDS
+    ) -> Dict[str, Any]:
+        """Extract information from a LinkedIn profile.
+
+        Args:
+            url: The profile URL
+            fields: Profile fields the caller needs. Sections that contribute
+                none of them are skipped, e.g. pass ``{"name", "company", "fund"}``
+                for a cheap first-pass filter before deep evaluation.
+        """
         logger.info(f"Starting LinkedIn profile extraction for URL: {url}")
+        # Selector lists are cached per field set, which must be hashable
+        fields = frozenset(fields)
+
+        cached = self._cached_profile(url, fields)
+        if cached is not None:
+            return cached
 
         # Use our safe navigation utility with retries and better error handling
         if not self._safe_navigate(url, timeout=60000, retry_count=2):
@@ -272,394 +569,265 @@ class LinkedInHandler:
 
         logger.info("Page loaded successfully, proceeding with data extraction")
 
-        profile_data = {
-            "url": url,
-            "name": "",
-            "headline": "",
-            "company": "",
-            "location": "",
-            "about": "",
-            "experience": [],
-            "education": [],
-            "fund": "",
-        }
-
-        # Extract name - this is critical, exit with error if not found
-        name_found = False
+        selectors = self._profile_selectors(fields)
+        page = getattr(self.browser, "page", None)
         try:
-            # Try multiple selectors for the name
-            name_selectors = [
-                "h1.text-heading-xlarge",
-                "h1.inline",
-                "h1.text-heading-large",
-            ]
-
-            for selector in name_selectors:
-                try:
-                    name_element = self.browser.find_element(selector)
-                    if name_element:
-                        name = self._safe_get_text(name_element)
-                        if name and len(name) > 0:
-                            profile_data["name"] = name
-                            logger.info(f"Extracted name: {profile_data['name']}")
-                            name_found = True
-                            break
-                except Exception as e:
-                    continue
-
-            if not name_found:
-                error_msg = "Could not extract profile name - LinkedIn profile data cannot be processed"
-                logger.error(error_msg)
-                return {"url": url, "error": error_msg}
-
+            if page is not None:
+                extracted = page.evaluate(_PROFILE_JS, selectors)
+            else:
+                # Backends without page scripting look each field up in turn
+                extracted = self._query_profile(selectors)
         except Exception as e:
-            error_msg = f"Error finding name element: {str(e)}"
+            error_msg = f"Error extracting profile data: {str(e)}"
             logger.error(error_msg)
             return {"url": url, "error": error_msg}
 
-        try:
-            headline_element = self.browser.find_element("div.text-body-medium")
-            if headline_element:
-                try:
-                    profile_data["headline"] = self._safe_get_text(headline_element)
-                    logger.info(f"Extracted headline: {profile_data['headline']}")
-                except Exception as e:
-                    logger.warning(f"Could not extract headline: {str(e)}")
-            else:
-                logger.warning("Headline element not found")
-        except Exception as e:
-            logger.warning(f"Error finding headline element: {str(e)}")
+        return self._build_profile(url, fields, extracted)
 
-        try:
-            location_element = self.browser.find_element(
-                "span.text-body-small[aria-hidden='true']"
-            )
-            if location_element:
-                try:
-                    profile_data["location"] = self._safe_get_text(location_element)
-                    logger.info(f"Extracted location: {profile_data['location']}")
-                except Exception as e:
-                    logger.warning(f"Could not extract location: {str(e)}")
-            else:
-                logger.warning("Location element not found")
-        except Exception as e:
-            logger.warning(f"Error finding location element: {str(e)}")
+    def _query_profile(self, sel: Dict[str, Any]) -> Dict[str, Any]:
+        """Element-by-element equivalent of _PROFILE_JS, in the same shape."""
+        if self._safe_query(sel["loginWall"]):
+            return {"loginWall": True}
 
-        # Extract about section with improved error handling
-        try:
-            about_element = self.browser.find_element(
-                "div.display-flex.ph5.pv3 > div.pv-shared-text-with-see-more"
+        experience = [
+            {
+                "title": self._first_text(sel["title"], item),
+                "company": self._first_text(sel["company"], item),
+            }
+            for item in self._section_items(
+                sel["experienceSection"], sel["experienceItem"], 3
             )
-            if about_element:
-                try:
-                    profile_data["about"] = self._safe_get_text(about_element)
-                    logger.info(
-                        f"Extracted about section, length: {len(profile_data['about'])}"
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not extract about text: {str(e)}")
-            else:
-                logger.warning("About element not found")
-        except Exception as e:
-            logger.warning(f"Error finding about element: {str(e)}")
-
-        # Make sure we return a valid profile even with extraction errors
-        if profile_data["name"]:
-            logger.info(
-                f"Successfully extracted basic profile for: {profile_data['name']}"
+        ]
+        education = [
+            {
+                "school": self._first_text(sel["school"], item),
+                "degree": self._first_text(sel["degree"], item),
+            }
+            for item in self._section_items(
+                sel["educationSection"], sel["educationItem"], 2
             )
+        ]
+        return {
+            "name": self._first_text(sel["name"]),
+            "headline": self._first_text(sel["headline"]),
+            "location": self._first_text(sel["location"]),
+            "about": self._first_text(sel["about"]),
+            "experience": [e for e in experience if e["title"] or e["company"]],
+            "education": [e for e in education if e["school"] or e["degree"]],
+        }
 
-            # If we couldn't extract any experience but we have a headline, use it to create a minimal experience
-            if not profile_data["experience"] and profile_data["headline"]:
-                headline = profile_data["headline"]
-                logger.info(f"Creating minimal experience from headline: {headline}")
-
-                # Parse headline to extract potential job title and company
-                title_parts = []
-                company = ""
-
-                if " at " in headline:
-                    parts = headline.split(" at ")
-                    title_parts = [parts[0].strip()]
-                    company = parts[1].strip()
-                elif " @ " in headline:
-                    parts = headline.split(" @ ")
-                    title_parts = [parts[0].strip()]
-                    company = parts[1].strip()
-                else:
-                    title_parts = [headline]
-
-                # Add the experience from headline
-                profile_data["experience"].append(
-                    {
-                        "title": title_parts[0] if title_parts else headline,
-                        "company": company,
-                    }
-                )
-
-                # Also set the company field if not already set
-                if not profile_data["company"] and company:
-                    profile_data["company"] = company
-
-                    # Look for fund keywords in the company name
-                    lower_company = company.lower()
-                    if any(
-                        keyword in lower_company
-                        for keyword in ["capital", "ventures", "partners", "fund"]
-                    ):
-                        profile_data["fund"] = company
-                        logger.info(f"Set fund to: {company}")
-
-        # Extract experience (only first few) with improved error handling
+    def _safe_query(self, selector: str, root=None):
+        """Return the first element matching selector, or None on any error."""
         try:
-            # Try multiple selectors for experience section - LinkedIn changes their selectors frequently
-            experience_selectors = [
-                "section#experience-section",
-                "section.experience-section",
-                "div.experience-section",
-                "#experience",
-            ]
-
-            experience_section = None
-            for selector in experience_selectors:
-                try:
-                    experience_section = self.browser.find_element(selector)
-                    if experience_section:
-                        logger.info(
-                            f"Found experience section with selector: {selector}"
-                        )
-                        break
-                except Exception as e:
-                    logger.warning(
-                        f"Error finding experience selector {selector}: {str(e)}"
-                    )
+            if root is None:
+                return self.browser.query(selector)
+            return self.browser.query(selector, root)
+        except Exception as e:
+            logger.warning(f"Error finding element with selector {selector}: {str(e)}")
+            return None
+
+    def _first_text(self, selectors, root=None) -> str:
+        """Text of the first selector that matches with non-empty text."""
+        for selector in selectors:
+            text = self._safe_get_text(self._safe_query(selector, root))
+            if text:
+                return text
+        return ""
+
+    def _section_items(self, section_selectors, item_selectors, limit: int) -> list:
+        """The first limit items of the first section found, by item selector."""
+        if not section_selectors:
+            return []
+        section = self._safe_query(", ".join(section_selectors))
+        if not section:
+            return []
+        for selector in item_selectors:
+            items = self._safe_find_elements(selector, section)
+            if items:
+                return items[:limit]
+        return []
+
+    def extract_profiles_many(
+        self,
+        urls: List[str],
+        fields: Iterable[str] = FULL_PROFILE_FIELDS,
+        concurrency: int = 4,
+    ) -> Iterator[Dict[str, Any]]:
+        """Extract several profiles, loading up to `concurrency` at a time.
+
+        Each batch of URLs is opened in its own tabs and all navigations are
+        started before any page is read, so their load times overlap. Profiles
+        are yielded as they become available (cached ones first), so match
+        results to URLs through their "url" key. Backends without tabs fall
+        back to calling extract_profile for each URL.
+        """
+        fields = frozenset(fields)
+        context = getattr(getattr(self.browser, "page", None), "context", None)
+        if context is None or concurrency < 2:
+            for url in urls:
+                yield self.extract_profile(url, fields)
+            return
+
+        pages = []
+        pending = []
+        try:
+            for url in urls:
+                cached = self._cached_profile(url, fields)
+                if cached is not None:
+                    yield cached
                     continue
 
-            if experience_section:
-                # Try multiple selectors for experience items - using safe method
-                item_selectors = [
-                    "li.pv-entity__position-group-pager",
-                    "li.pvs-list__item--line-separated",
-                    "div.pvs-entity",
-                ]
-
-                experience_items = []
-                for selector in item_selectors:
-                    items = self._safe_find_elements(selector, experience_section)
-                    if items:
-                        experience_items = items
-                        logger.info(
-                            f"Found {len(items)} experience items with selector: {selector}"
-                        )
-                        break
-
-                for i, item in enumerate(
-                    experience_items[:3]
-                ):  # Limit to first 3 experiences
-                    try:
-                        # Safe text extraction with fallbacks
-                        title = ""
-                        company = ""
-
-                        # Try multiple selectors for title
-                        title_selectors = [
-                            "h3.t-16",
-                            "span.t-16",
-                            "span.mr1 span",
-                            "span.mr1",
-                        ]
-                        for selector in title_selectors:
-                            try:
-                                title_element = self.browser.find_element(
-                                    selector, item
-                                )
-                                if title_element:
-                                    title = self._safe_get_text(title_element)
-                                    if title:
-                                        break
-                            except:
-                                continue
-
-                        # Try multiple selectors for company
-                        company_selectors = [
-                            "p.pv-entity__secondary-title",
-                            "span.t-14",
-                            "span.t-normal",
-                        ]
-                        for selector in company_selectors:
-                            try:
-                                company_element = self.browser.find_element(
-                                    selector, item
-                                )
-                                if company_element:
-                                    company = self._safe_get_text(company_element)
-                                    if company:
-                                        break
-                            except:
-                                continue
-
-                        if title or company:  # Only add if we found at least one field
-                            experience = {"title": title, "company": company}
-
-                            profile_data["experience"].append(experience)
-                            logger.info(
-                                f"Added experience {i + 1}: {title} at {company}"
-                            )
-
-                            # Set current company if not already set
-                            if (
-                                not profile_data["company"]
-                                and company
-                                and len(profile_data["experience"]) == 1
-                            ):
-                                profile_data["company"] = company
-                                logger.info(f"Set current company to: {company}")
-
-                                # Look for fund names in the company title
-                                lower_company = company.lower()
-                                if any(
-                                    keyword in lower_company
-                                    for keyword in [
-                                        "capital",
-                                        "ventures",
-                                        "partners",
-                                        "fund",
-                                    ]
-                                ):
-                                    profile_data["fund"] = company
-                                    logger.info(f"Set fund to: {company}")
-                    except Exception as e:
-                        logger.warning(
-                            f"Error extracting experience item {i + 1}: {str(e)}"
-                        )
-                        continue
-            else:
-                logger.warning("Experience section not found")
-        except Exception as e:
-            logger.warning(f"Error finding experience section: {str(e)}")
+                pending.append(url)
+                if len(pending) == concurrency:
+                    yield from self._extract_batch(pending, fields, context, pages)
+                    pending = []
 
-        # Extract education (only first few) with improved error handling
-        try:
-            # Try multiple selectors for education section
-            education_selectors = [
-                "section#education-section",
-                "section.education-section",
-                "div.education-section",
-                "#education",
-            ]
-
-            education_section = None
-            for selector in education_selectors:
+            if pending:
+                yield from self._extract_batch(pending, fields, context, pages)
+        finally:
+            for page in pages:
                 try:
-                    education_section = self.browser.find_element(selector)
-                    if education_section:
-                        logger.info(
-                            f"Found education section with selector: {selector}"
-                        )
-                        break
-                except Exception as e:
-                    logger.warning(
-                        f"Error finding education selector {selector}: {str(e)}"
-                    )
+                    page.close()
+                except Exception:
+                    pass
+
+    def _extract_batch(
+        self, urls: List[str], fields: frozenset, context, pages: list
+    ) -> Iterator[Dict[str, Any]]:
+        """Load urls in parallel tabs, then extract each profile in turn."""
+        # Grow the tab pool on demand; tabs are reused by later batches
+        while len(pages) < len(urls):
+            page = context.new_page()
+            block_resources = getattr(self.browser, "block_resources", None)
+            if block_resources:
+                block_resources(page=page)
+            pages.append(page)
+
+        # Only wait for the navigation to commit so the other tabs can start
+        started = []
+        for url, page in zip(urls, pages):
+            try:
+                page.goto(url, wait_until="commit", timeout=60000)
+                started.append((url, page))
+            except Exception as e:
+                logger.warning(f"Failed to start loading {url}: {str(e)}")
+                yield {
+                    "url": url,
+                    "error": "Failed to load profile due to navigation error or timeout",
+                }
+
+        for url, page in started:
+            try:
+                page.wait_for_selector("h1, main", timeout=60000, state="attached")
+                if _LOGIN_URL_RE.search(page.url):
+                    logger.error(f"Redirected to login page: {page.url}")
+                    yield {"url": url, "error": "Redirected to login page"}
                     continue
+                extracted = page.evaluate(_PROFILE_JS, self._profile_selectors(fields))
+            except Exception as e:
+                error_msg = f"Error extracting profile data: {str(e)}"
+                logger.error(error_msg)
+                yield {"url": url, "error": error_msg}
+                continue
+
+            yield self._build_profile(url, fields, extracted)
+
+    def _cached_profile(self, url: str, fields: frozenset) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached extraction of url covering fields, if any."""
+        if not self._cache:
+            return None
+        cache_key = _normalize_profile_url(url) or url
+        cached = self._cache.get(cache_key, fields)
+        if cached is not None:
+            logger.info(f"Using cached profile data for {cache_key}")
+        return cached
+
+    def _build_profile(
+        self, url: str, fields: frozenset, extracted: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Turn raw _PROFILE_JS output into profile data and cache it."""
+        if extracted.get("loginWall"):
+            logger.error("Login wall detected for %s", url)
+            return {"url": url, "error": "login_required"}
+
+        # The name is critical, exit with error if not found
+        if not extracted["name"]:
+            error_msg = "Could not extract profile name - LinkedIn profile data cannot be processed"
+            logger.error(error_msg)
+            return {"url": url, "error": error_msg}
 
-            if education_section:
-                # Try multiple selectors for education items - using safe method
-                item_selectors = [
-                    "li.pv-education-entity",
-                    "li.pvs-list__item--line-separated",
-                    "div.pvs-entity",
-                ]
-
-                education_items = []
-                for selector in item_selectors:
-                    items = self._safe_find_elements(selector, education_section)
-                    if items:
-                        education_items = items
-                        logger.info(
-                            f"Found {len(items)} education items with selector: {selector}"
-                        )
-                        break
+        profile_data = {"url": url, **extracted, "company": "", "fund": ""}
+        experience = profile_data["experience"]
+        headline = profile_data["headline"]
+
+        # Use the headline to create a minimal experience, it usually names the
+        # current position more reliably than the experience section
+        if headline:
+            logger.info(f"Creating minimal experience from headline: {headline}")
+
+            # Parse headline to extract potential job title and company
+            title, company = headline, ""
+            for separator in (" at ", " @ "):
+                if separator in headline:
+                    parts = headline.split(separator)
+                    title, company = parts[0].strip(), parts[1].strip()
+                    break
 
-                for i, item in enumerate(
-                    education_items[:2]
-                ):  # Limit to first 2 educational experiences
-                    try:
-                        # Safe text extraction with fallbacks
-                        school = ""
-                        degree = ""
-
-                        # Try multiple selectors for school
-                        school_selectors = [
-                            "h3.pv-entity__school-name",
-                            "span.t-16",
-                            "span.mr1 span",
-                            "span.mr1",
-                        ]
-                        for selector in school_selectors:
-                            try:
-                                school_element = self.browser.find_element(
-                                    selector, item
-                                )
-                                if school_element:
-                                    school = self._safe_get_text(school_element)
-                                    if school:
-                                        break
-                            except:
-                                continue
-
-                        # Try multiple selectors for degree
-                        degree_selectors = [
-                            "p.pv-entity__degree-name span.pv-entity__comma-item",
-                            "span.t-14",
-                            "span.t-normal",
-                        ]
-                        for selector in degree_selectors:
-                            try:
-                                degree_element = self.browser.find_element(
-                                    selector, item
-                                )
-                                if degree_element:
-                                    degree = self._safe_get_text(degree_element)
-                                    if degree:
-                                        break
-                            except:
-                                continue
-
-                        if school or degree:  # Only add if we found at least one field
-                            education = {"school": school, "degree": degree}
-
-                            profile_data["education"].append(education)
-                            logger.info(
-                                f"Added education {i + 1}: {degree} at {school}"
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"Error extracting education item {i + 1}: {str(e)}"
-                        )
-                        continue
-            else:
-                logger.warning("Education section not found")
-        except Exception as e:
-            logger.warning(f"Error finding education section: {str(e)}")
+            experience.insert(0, {"title": title, "company": company})
 
-        # Log the final profile data summary
-        logger.info(
-            f"Completed profile extraction for {profile_data.get('name', 'Unknown')}"
-            + f" with {len(profile_data.get('experience', []))} experience items"
-            + f" and {len(profile_data.get('education', []))} education items"
-        )
+        # The current company is the first one listed
+        for item in experience:
+            if item["company"]:
+                profile_data["company"] = item["company"]
+                logger.info(f"Set current company to: {item['company']}")
 
-        # Return the completed profile data
-        return profile_data
+                # Look for fund names in the company title
+                if _FUND_RE.search(item["company"]):
+                    profile_data["fund"] = item["company"]
+                    logger.info(f"Set fund to: {item['company']}")
+                break
+
+        if self._cache:
+            self._cache.set(_normalize_profile_url(url) or url, fields, profile_data)
+
+        # Log the final profile data summary and return the completed profile data
+        return self._log_extraction_summary(url, profile_data)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _profile_selectors(fields: frozenset) -> Dict[str, Any]:
+        """Selector lists for _PROFILE_JS, leaving out sections not in fields.
+
+        Built once per distinct field set; callers must not mutate the result.
+        """
+
+        def wanted(*names):
+            return not fields.isdisjoint(names)
+
+        with_experience = wanted("experience", "company", "fund")
+        with_education = wanted("education")
+        return {
+            "loginWall": _LOGIN_WALL_SELECTOR,
+            "name": _NAME_SELECTORS,
+            "headline": _HEADLINE_SELECTORS,
+            "location": _LOCATION_SELECTORS if wanted("location") else (),
+            "about": _ABOUT_SELECTORS if wanted("about") else (),
+            "experienceSection": (
+                _EXPERIENCE_SECTION_SELECTORS if with_experience else ()
+            ),
+            "experienceItem": _EXPERIENCE_ITEM_SELECTORS,
+            "title": _TITLE_SELECTORS,
+            "company": _COMPANY_SELECTORS,
+            "educationSection": (
+                _EDUCATION_SECTION_SELECTORS if with_education else ()
+            ),
+            "educationItem": _EDUCATION_ITEM_SELECTORS,
+            "school": _SCHOOL_SELECTORS,
+            "degree": _DEGREE_SELECTORS,
+        }
 
     def get_previous_messages(self, profile_url: str) -> List[str]:
         """Check for previous message history with this contact."""
-        import logging
-
-        # Initialize logger
-        logger = logging.getLogger("seed_pitcher")
-
         try:
             # Use safe navigation instead of direct navigation
             if not self._safe_navigate(profile_url, timeout=60000, retry_count=2):
@@ -670,79 +838,32 @@ class LinkedInHandler:
 
             # Make sure we're properly logged in
             logger.info("Checking login status before proceeding")
+            if self.browser.query(_LOGIN_WALL_SELECTOR):
+                logger.error("Login wall detected for %s", profile_url)
+                return []
 
-            # Look for the message button with multiple and more precise selectors
-            message_selectors = [
-                "button.message-anywhere-button",
-                "button.pv-s-profile-actions--message",
-                "button[aria-label='Message']",
-                "button.artdeco-button--primary",
-                "a.message-anywhere-button",
-                "a[data-control-name='message']",
-                # More specific selectors
-                "button.artdeco-button.artdeco-button--2.artdeco-button--primary",
-                "button.pvs-profile-actions__action",
-                "button.pvs-profile-actions__action.artdeco-button",
-                # General messaging buttons
-                "button:has-text('Message')",
-                "a:has-text('Message')",
-            ]
-
-            message_button = None
-            for selector in message_selectors:
-                try:
-                    logger.info(f"Looking for message button with selector: {selector}")
-                    message_button = self.browser._safe_find_elements('button.artdeco-button')[7]
-                    if message_button:
-                        logger.info(f"Found message button with selector: {selector}")
-                        break
-                except Exception as e:
-                    continue
-
-            # If we still can't find it, try searching for any button with "Message" text
-            if not message_button:
-                try:
-                    logger.info("Trying to find message button by text content")
-                    # Get all buttons on the page
-                    all_buttons = self.browser.find_elements("button")
-                    for button in all_buttons:
-                        button_text = self._safe_get_text(button)
-                        if "message" in button_text.lower():
-                            message_button = button
-                            logger.info(
-                                f"Found message button with text: {button_text}"
-                            )
-                            break
-                except Exception as e:
-                    logger.warning(f"Error finding buttons by text: {str(e)}")
+            message_button = self._locate_message_button(profile_url)
 
             if not message_button:
                 return []  # No message button found, can't check history
 
             # Click the message button to open the chat window
             self.browser.click(message_button)
-            time.sleep(2)
-
-            # Check if there are previous messages
-            message_history_selectors = [
-                ".msg-s-message-list__event",
-                ".msg-s-message-list-content",
-                ".msg-s-message-group__meta",
-            ]
-
-            # Look for message history
-            messages = []
-            for selector in message_history_selectors:
+            self._wait_for_message_window(timeout=10000)
+
+            # Read every message history entry's text in one call where the
+            # backend can run page scripts
+            page = getattr(self.browser, "page", None)
+            if page is not None:
                 try:
-                    message_elements = self.browser.find_elements(selector)
-                    if message_elements:
-                        # Extract text from message elements
-                        for element in message_elements:
-                            msg_text = self._safe_get_text(element)
-                            if msg_text:
-                                messages.append(msg_text)
+                    messages = page.evaluate(
+                        _MESSAGE_HISTORY_JS, _MESSAGE_HISTORY_SELECTORS
+                    )
                 except Exception as e:
-                    continue
+                    logger.warning(f"Error reading message history: {str(e)}")
+                    messages = []
+            else:
+                messages = self._query_message_history()
 
             # Close the message window
             try:
@@ -757,20 +878,82 @@ class LinkedInHandler:
             return messages
 
         except Exception as e:
-            import logging
+            logger.warning(f"Failed to check previous messages: {str(e)}")
+            return []
 
-            logging.getLogger(__name__).warning(
-                f"Failed to check previous messages: {str(e)}"
+    def _query_message_history(self) -> List[str]:
+        """Element-by-element equivalent of _MESSAGE_HISTORY_JS."""
+        messages = []
+        seen = set()
+        for selector in _MESSAGE_HISTORY_SELECTORS:
+            try:
+                elements = self.browser.find_elements(selector)
+            except Exception as e:
+                logger.warning(f"Error finding messages with selector {selector}: {str(e)}")
+                continue
+            for element in elements:
+                text = self._safe_get_text(element)
+                # The selectors overlap, so keep each text once
+                if text and text not in seen:
+                    seen.add(text)
+                    messages.append(text)
+        return messages
+
+    def _locate_message_button(self, profile_url: str):
+        """Find the message button, reusing the one found last on this page."""
+        page_key = _normalize_for_compare(profile_url)
+        if self._message_button and self._message_button[0] == page_key:
+            try:
+                if self._message_button[1].is_visible():
+                    logger.debug("Reusing message button found earlier")
+                    return self._message_button[1]
+            except Exception:
+                pass  # Detached from the page, look it up again
+
+        message_button = self._find_message_button()
+        self._message_button = (page_key, message_button) if message_button else None
+        return message_button
+
+    def _wait_for_message_window(self, timeout: int) -> None:
+        """Wait until the chat window's message input is visible."""
+        page = getattr(self.browser, "page", None)
+        try:
+            if page is not None:
+                page.wait_for_selector(
+                    _MESSAGE_INPUT_SELECTOR, state="visible", timeout=timeout
+                )
+            elif not self._wait_for_element(_MESSAGE_INPUT_SELECTOR, timeout):
+                raise TimeoutError(_MESSAGE_INPUT_SELECTOR)
+        except Exception:
+            # Callers carry on regardless, as they did after a fixed sleep
+            logger.info("Message window did not appear")
+
+    def _wait_for_element(self, selector: str, timeout: int):
+        """browser.wait_for_element with timeout in milliseconds on every backend."""
+        if isinstance(self.browser, SimularBrowser):
+            # Selenium's waits take seconds
+            return self.browser.wait_for_element(selector, timeout=timeout / 1000)
+        return self.browser.wait_for_element(selector, timeout=timeout)
+
+    def _find_message_button(self):
+        """Find the message button by selector or text in a single page call."""
+        try:
+            handle = self.browser.page.evaluate_handle(
+                _MESSAGE_BUTTON_JS,
+                [_MESSAGE_BUTTON_PRECISE_SELECTORS, _MESSAGE_BUTTON_GENERIC_SELECTORS],
             )
-            return []
+            button = handle.as_element()
+        except Exception as e:
+            # Backends without page scripting still get the selector lookup
+            logger.debug(f"Falling back to selector query for message button: {str(e)}")
+            button = self.browser.query(_MESSAGE_BUTTON_SELECTOR)
+
+        if button:
+            logger.debug("Found message button")
+        return button
 
     def send_message(self, profile_url: str, message: str) -> bool:
         """Send a message to a LinkedIn contact using Playwright."""
-        import logging
-        import time
-
-        logger = logging.getLogger("seed_pitcher")
-
         try:
             # Use our new safe navigation utility instead of duplicating code
             if not self._safe_navigate(profile_url, timeout=60000, retry_count=2):
@@ -779,50 +962,7 @@ class LinkedInHandler:
                 )
                 return False
 
-            # Look for the message button with multiple and more precise selectors
-            message_selectors = [
-                "button.message-anywhere-button",
-                "button.pv-s-profile-actions--message",
-                "button[aria-label='Message']",
-                "button.artdeco-button--primary",
-                "a.message-anywhere-button",
-                "a[data-control-name='message']",
-                # More specific selectors
-                "button.artdeco-button.artdeco-button--2.artdeco-button--primary",
-                "button.pvs-profile-actions__action",
-                "button.pvs-profile-actions__action.artdeco-button",
-                # General messaging buttons
-                "button:has-text('Message')",
-                "a:has-text('Message')",
-            ]
-
-            message_button = None
-            for selector in message_selectors:
-                try:
-                    logger.info(f"Looking for message button with selector: {selector}")
-                    message_button = self.browser.find_element(selector)
-                    if message_button:
-                        logger.info(f"Found message button with selector: {selector}")
-                        break
-                except Exception as e:
-                    continue
-
-            # If we still can't find it, try searching for any button with "Message" text
-            if not message_button:
-                try:
-                    logger.info("Trying to find message button by text content")
-                    # Get all buttons on the page
-                    all_buttons = self.browser.find_elements("button")
-                    for button in all_buttons:
-                        button_text = self._safe_get_text(button)
-                        if "message" in button_text.lower():
-                            message_button = button
-                            logger.info(
-                                f"Found message button with text: {button_text}"
-                            )
-                            break
-                except Exception as e:
-                    logger.warning(f"Error finding buttons by text: {str(e)}")
+            message_button = self._locate_message_button(profile_url)
 
             if not message_button:
                 logger.warning("Could not find message button on profile")
@@ -837,10 +977,9 @@ class LinkedInHandler:
 
                 # Ensure the element is in view before clicking
                 self.browser.page.evaluate(
-                    "(element) => element.scrollIntoView({behavior: 'smooth', block: 'center'})",
+                    "(element) => element.scrollIntoView({block: 'center'})",
                     message_button,
                 )
-                time.sleep(1)  # Wait for scrolling to complete
             except Exception as vis_error:
                 logger.warning(f"Error making browser visible: {str(vis_error)}")
                 # Continue anyway since this is just a visibility enhancement
@@ -888,14 +1027,9 @@ class LinkedInHandler:
             #     # Wait between attempts
             #     time.sleep(2)
 
-            # Wait longer for the message modal to fully appear
+            # Wait for the message modal to fully appear
             logger.info("Waiting for message window to fully appear")
-            time.sleep(5)  # Give the message window time to fully render
-
-            # Look for message input field with expanded selectors
-            message_input_selectors = [
-                "div[role=textbox]"
-            ]
+            self._wait_for_message_window(timeout=5000)
 
             # # Try multiple times with a delay to find the input field
             # # Sometimes it takes time for the message modal to fully render
@@ -907,7 +1041,7 @@ class LinkedInHandler:
             #         f"Message input search attempt {attempt + 1}/{max_attempts}"
             #     )
 
-            #     for selector in message_input_selectors:
+            #     for selector in _MESSAGE_INPUT_SELECTORS:
             #         try:
             #             message_input = self.browser.find_element(selector)
             #             if message_input:
@@ -948,7 +1082,7 @@ class LinkedInHandler:
             #             time.sleep(1)
 
             #             # Now try to find the input field again
-            #             for selector in message_input_selectors:
+            #             for selector in _MESSAGE_INPUT_SELECTORS:
             #                 try:
             #                     message_input = self.browser.find_element(selector)
             #                     if message_input:
@@ -973,17 +1107,17 @@ class LinkedInHandler:
             logger.info("Typing message")
             # self.browser.fill(message_input, message)
             self.browser.page.keyboard.insert_text(message)
-            time.sleep(1)
+            try:
+                # The send button enables once the typed text has registered
+                self.browser.page.wait_for_selector(
+                    "button.msg-form__send-button:not([disabled])", timeout=5000
+                )
+            except Exception:
+                logger.info("Send button did not become enabled")
 
             # # Look for send button
-            # send_button_selectors = [
-            #     "button.msg-form__send-button",
-            #     "button[type='submit']",
-            #     "button.artdeco-button--primary",
-            # ]
-
             # send_button = None
-            # for selector in send_button_selectors:
+            # for selector in _SEND_BUTTON_SELECTORS:
             #     try:
             #         send_button = self.browser.find_element(selector)
             #         if send_button:
@@ -1020,14 +1154,15 @@ class LinkedInHandler:
 
     def _log_extraction_summary(self, url, profile_data):
         """Log a summary of the extracted profile data."""
-        import logging
-
-        logger = logging.getLogger(__name__)
-        logger.info(f"Profile extraction completed for: {url}")
         logger.info(
-            f"Profile data: name='{profile_data['name']}', headline='{profile_data['headline']}', "
-            + f"company='{profile_data['company']}', experiences={len(profile_data['experience'])}, "
-            + f"education={len(profile_data['education'])}"
+            "Profile extraction completed for: %s - name=%r, headline=%r, "
+            "company=%r, experiences=%d, education=%d",
+            url,
+            profile_data["name"],
+            profile_data["headline"],
+            profile_data["company"],
+            len(profile_data["experience"]),
+            len(profile_data["education"]),
         )
 
         return profile_data
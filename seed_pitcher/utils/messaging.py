@@ -1,137 +1,230 @@
 """Utilities for drafting investor messages."""
 
-from typing import Dict, Any
-from langchain_core.language_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate
+import logging
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+import seed_pitcher.config as config
+from seed_pitcher.utils.cache import get_llm_cache, llm_cache_key
+from seed_pitcher.utils.tokens import count_tokens, split_tokens, truncate_tokens
+
+logger = logging.getLogger("seed_pitcher.messaging")
+
+# langchain is slow to import and only needed here for type hints
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+_INVESTOR_MESSAGE_TEMPLATE = """Draft a short, personalized LinkedIn message (max 120 words) from a startup founder to a potential investor.
+
+INVESTOR: {investor_name} | {investor_headline} | {investor_company}
+FOUNDER: {founder_name}
+PITCH: {elevator_pitch}
+
+RULES:
+- Open with a brief personal connection if possible; keep a professional but conversational tone and respect their time.
+- The founder's name is exactly "{founder_name}". Use it in the intro and signature; never substitute another name such as "Alex".
+- Be specific: name the problem, the unique value and 1-2 concrete details (an achievement, metric or technology) taken from the pitch.
+- Use only facts stated in the pitch. Invent nothing, and don't mention industries or technologies (e.g. space) it doesn't name.
+- Don't mention the investor's focus or portfolio, or reveal fundraising details; just ask if they'd like to learn more.
+
+End with:
+Best,
+{founder_name}
+"""
+
+_PITCH_DECK_TEMPLATE = """Summarize this pitch deck text in at most 200 words for writing investor outreach.
+Cover: value proposition, market and traction metrics, competitive advantages, team highlights, and funding ask and use of funds.
+Use specific, compelling details rather than generic statements.
+
+PITCH DECK:
+{pitch_deck_text}
+"""
+
+# Sent instead of an LLM draft when there is no pitch to personalize from
+_GENERIC_INVESTOR_MESSAGE = """Hi {investor_name},
+
+I noticed your work{at_company} and wanted to connect. I'm working on an early-stage startup and would value your perspective. Would you be open to a quick conversation?
+
+Best,
+{founder_name}"""
+
+# Most deck tokens sent to the LLM in one prompt, to stay within token limits
+_PITCH_DECK_CHUNK_TOKENS = 6000
 
 
 def draft_investor_message(
     profile: Dict[str, Any],
     analysis: Dict[str, Any],
     startup_info: Dict[str, str],
-    llm: BaseChatModel,
+    llm: "BaseChatModel",
 ) -> str:
     """Draft a personalized message to an investor based on their profile and analysis."""
-    # Create prompt template for message drafting
-    template = """
-    You are an expert in crafting effective initial outreach messages for startups to send to potential investors.
-    Your task is to draft a brief, personalized LinkedIn message from a startup founder to a potential investor.
-    
-    ### Investor Information:
-    - Name: {investor_name}
-    - Current position: {investor_headline}
-    - Fund/Company: {investor_company}
-    
-    ### Startup Information:
-    - Elevator pitch: {elevator_pitch}
-    - Founder name: {founder_name}
-    
-    Draft a short, personalized LinkedIn message (max 120 words) to this investor that:
-    1. Establishes a brief personal connection if possible
-    2. EXACTLY identifies the founder as "{founder_name}" (use the EXACT name provided, do NOT substitute with any other name like 'Alex')
-    3. Includes specific details from the elevator pitch - focus on the problem being solved and unique value proposition
-    4. Mentions 1-2 SPECIFIC and CONCRETE details about what the startup is building (extracted directly from the elevator pitch)
-    5. Expresses interest in connecting but DOES NOT reveal detailed fundraising intentions
-    6. Asks if they'd like to learn more
-    7. Maintains a professional but conversational tone
-    
-    IMPORTANT GUIDELINES:
-    - CRITICAL: The founder's name is "{founder_name}" - ALWAYS use this EXACT name in the intro and signature
-    - NEVER use "Alex" or any other name - ONLY use "{founder_name}" as the founder's name
-    - Be SPECIFIC about what the startup does - avoid vague terms like "what we're building"
-    - Use ACTUAL DETAILS from the elevator pitch - don't be generic
-    - Extract and include at least one CONCRETE achievement, metric, or specific technology mentioned in the elevator pitch
-    - DO NOT invent or assume ANY details about the startup - use ONLY information explicitly provided in the elevator pitch
-    - DO NOT make generic references to industries or technologies if they are not in the elevator pitch
-    - NEVER mention "space technology", "space infrastructure" or similar terms unless they are explicitly in the elevator pitch
-    - DO NOT mention the investor's investment focus or portfolio companies
-    - DO NOT reveal detailed fundraising information
-    - Be respectful of their time
-    
-    The message should include SPECIFIC details from the elevator pitch while maintaining a conversational tone.
-    
-    In the signature, ONLY use "{founder_name}" as the name, for example:
-    
-    Best,
-    {founder_name}
-    
-    Do NOT use any other name like 'Alex' in the signature or anywhere in the message.
-    """
+    fields = _investor_message_fields(profile, analysis, startup_info)
+    if not _has_pitch(startup_info):
+        logger.info("No elevator pitch, sending a generic message without the LLM")
+        return _generic_investor_message(fields)
 
-    # Extract investor information
-    investor_name = profile.get("name", "Investor") if profile else "Investor"
-    investor_headline = profile.get("headline", "") if profile else ""
-
-    # Determine investor company
-    investor_company = ""
-    if profile:
-        if profile.get("company"):
-            investor_company = profile.get("company")
-        elif profile.get("fund"):
-            investor_company = profile.get("fund")
-        elif profile.get("experience") and len(profile.get("experience")) > 0:
-            investor_company = profile["experience"][0].get("company", "")
-
-    # Use fund_name from analysis if no company found
-    if not investor_company and analysis:
-        investor_company = analysis.get("fund_name", "")
-
-    # Get elevator pitch
-    elevator_pitch = startup_info.get("elevator_pitch", "") if startup_info else ""
-
-    # Get founder name
-    founder_name = startup_info.get("founder_name", "Founder") if startup_info else "Founder"
-
-    # Create and format the prompt
-    prompt = ChatPromptTemplate.from_template(template)
-    formatted_prompt = prompt.format(
-        investor_name=investor_name,
-        investor_headline=investor_headline,
-        investor_company=investor_company,
-        elevator_pitch=elevator_pitch,
-        founder_name=founder_name,
-    )
+    formatted_prompt = _INVESTOR_MESSAGE_TEMPLATE.format(**fields)
+
+    # The same investor and pitch always get the same prompt, so reuse drafts
+    cache = get_llm_cache()
+    cache_key = llm_cache_key(llm, formatted_prompt)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     # Call LLM to generate the message - let errors propagate
     response = llm.invoke([formatted_prompt])
+    cache.set(cache_key, response.content)
     return response.content
 
 
-def summarize_pitch_deck(pitch_deck_text: str, llm: BaseChatModel) -> str:
-    """Summarize the pitch deck text to extract key information."""
-    # Create prompt template for summarization
-    template = """
-    You are an expert in analyzing startup pitch decks. I will provide you with the text 
-    extracted from a pitch deck, and I need you to summarize the key information that would 
-    be relevant for crafting an initial outreach message to a potential investor.
-    
-    Focus on extracting:
-    1. The core value proposition
-    2. Key market and traction metrics
-    3. Competitive advantages
-    4. Team highlights
-    5. Funding details (how much is being raised and for what purpose)
-    
-    Extracted pitch deck text:
-    {pitch_deck_text}
-    
-    Provide a concise summary (max 200 words) of the most important points that would help 
-    convince an investor to take a meeting. Avoid generic statements and focus on specific, 
-    compelling details.
+def draft_investor_messages_batch(
+    profiles: List[Dict[str, Any]],
+    analyses: List[Dict[str, Any]],
+    startup_info: Dict[str, str],
+    llm: "BaseChatModel",
+    max_concurrency: Optional[int] = None,
+) -> List[str]:
+    """Draft messages for several investors with concurrent LLM calls.
+
+    Returns one message per (profile, analysis) pair, in order, and raises
+    ValueError if the two lists differ in length. At most max_concurrency
+    requests run at once, config.LLM_MAX_CONCURRENCY by default.
     """
+    if max_concurrency is None:
+        max_concurrency = config.LLM_MAX_CONCURRENCY
+
+    all_fields = [
+        _investor_message_fields(profile, analysis, startup_info)
+        for profile, analysis in zip(profiles, analyses, strict=True)
+    ]
+    if not _has_pitch(startup_info):
+        logger.info("No elevator pitch, sending generic messages without the LLM")
+        return [_generic_investor_message(fields) for fields in all_fields]
+
+    prompts = [_INVESTOR_MESSAGE_TEMPLATE.format(**fields) for fields in all_fields]
+
+    cache = get_llm_cache()
+    cache_keys = [llm_cache_key(llm, prompt) for prompt in prompts]
+    messages = [cache.get(key) for key in cache_keys]
+    missing = [i for i, message in enumerate(messages) if message is None]
+
+    if missing:
+        # Call LLM for all uncached prompts at once - let errors propagate
+        responses = llm.batch(
+            [[prompts[i]] for i in missing],
+            config={"max_concurrency": max_concurrency},
+        )
+        for i, response in zip(missing, responses):
+            messages[i] = response.content
+            cache.set(cache_keys[i], response.content)
+
+    return messages
+
+
+def _investor_message_fields(
+    profile: Dict[str, Any],
+    analysis: Dict[str, Any],
+    startup_info: Dict[str, str],
+) -> Dict[str, str]:
+    """Investor message template fields from profile, analysis and startup info."""
+    profile = profile or {}
+    startup_info = startup_info or {}
+
+    # Determine investor company, falling back to the fund name from analysis
+    experience = profile.get("experience")
+    investor_company = (
+        profile.get("company")
+        or profile.get("fund")
+        or (experience[0].get("company", "") if experience else "")
+        or (analysis.get("fund_name", "") if analysis else "")
+    )
+
+    return {
+        "investor_name": profile.get("name", "Investor"),
+        "investor_headline": profile.get("headline", ""),
+        "investor_company": investor_company,
+        "elevator_pitch": startup_info.get("elevator_pitch", ""),
+        "founder_name": startup_info.get("founder_name", "Founder"),
+    }
+
+
+def _has_pitch(startup_info: Dict[str, str]) -> bool:
+    """Whether startup_info has an elevator pitch for the LLM to work from."""
+    return bool(startup_info and (startup_info.get("elevator_pitch") or "").strip())
+
 
-    # Limit text length to avoid token limits
-    limited_text = (
-        pitch_deck_text[:8000] if len(pitch_deck_text) > 8000 else pitch_deck_text
+def _generic_investor_message(fields: Dict[str, str]) -> str:
+    """Fill the generic investor message from the template fields."""
+    company = fields["investor_company"]
+    return _GENERIC_INVESTOR_MESSAGE.format(
+        investor_name=fields["investor_name"],
+        at_company=f" at {company}" if company else "",
+        founder_name=fields["founder_name"],
     )
 
-    # Create the prompt
-    prompt = ChatPromptTemplate.from_template(template)
+
+def summarize_pitch_deck(pitch_deck_text: str, llm: "BaseChatModel") -> str:
+    """Summarize the pitch deck text to extract key information.
+
+    Decks longer than one prompt's worth of text are split into chunks that
+    are summarized in parallel, and the partial summaries are then summarized
+    together, so no part of the deck is dropped.
+    """
+    # A run reuses one deck for every investor, so it only needs summarizing once
+    cache = get_llm_cache()
+    cache_key = llm_cache_key(llm, "pitch_deck_summary", pitch_deck_text)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    chunks = _chunk_pitch_deck(pitch_deck_text)
+    if len(chunks) > 1:
+        # Summarize each chunk concurrently, then combine the partial summaries
+        responses = llm.batch(
+            [[_PITCH_DECK_TEMPLATE.format(pitch_deck_text=chunk)] for chunk in chunks]
+        )
+        deck_text = "\n\n".join(response.content for response in responses)
+    else:
+        deck_text = pitch_deck_text
 
     # Format prompt with pitch deck text
-    formatted_prompt = prompt.format(pitch_deck_text=limited_text)
+    formatted_prompt = _PITCH_DECK_TEMPLATE.format(
+        pitch_deck_text=truncate_tokens(deck_text, _PITCH_DECK_CHUNK_TOKENS)
+    )
 
     # Call LLM to generate the summary
     response = llm.invoke([formatted_prompt])
 
+    cache.set(cache_key, response.content)
     return response.content
+
+
+def _chunk_pitch_deck(pitch_deck_text: str) -> List[str]:
+    """Split deck text into chunks of at most _PITCH_DECK_CHUNK_TOKENS tokens.
+
+    Chunks break between pages/paragraphs where possible; a single paragraph
+    longer than the limit is cut at the limit.
+    """
+    chunks = []
+    current = ""
+    current_tokens = 0
+    for paragraph in pitch_deck_text.split("\n\n"):
+        pieces = split_tokens(paragraph, _PITCH_DECK_CHUNK_TOKENS)
+        if len(pieces) > 1:
+            if current:
+                chunks.append(current)
+            chunks.extend(pieces[:-1])
+            current, current_tokens = "", 0
+            paragraph = pieces[-1]
+
+        paragraph_tokens = count_tokens(paragraph)
+        if current and current_tokens + paragraph_tokens > _PITCH_DECK_CHUNK_TOKENS:
+            chunks.append(current)
+            current, current_tokens = paragraph, paragraph_tokens
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+            current_tokens += paragraph_tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
@@ -1,7 +1,15 @@
 """PDF processing utilities for extracting text from pitch decks."""
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+# Decks with more pages than this are extracted in parallel; below it the
+# cost of starting worker processes outweighs the gain
+_PARALLEL_MIN_PAGES = 20
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
@@ -11,18 +19,49 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
 
         # Initialize PDF reader
         reader = PdfReader(pdf_path)
-        text = ""
+        num_pages = len(reader.pages)
 
-        # Extract text from each page
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n\n"
+        workers = min(os.cpu_count() or 1, num_pages)
+        if num_pages <= _PARALLEL_MIN_PAGES or workers < 2:
+            texts = [page.extract_text() for page in reader.pages]
+        else:
+            # Text layout is CPU-bound, so split the pages into one contiguous
+            # range per process; each worker opens the file once
+            step = -(-num_pages // workers)
+            ranges = [
+                (str(pdf_path), start, min(start + step, num_pages))
+                for start in range(0, num_pages, step)
+            ]
+            try:
+                # Spawn rather than fork: callers run thread pools and the
+                # Playwright driver thread, which a forked child can deadlock on
+                with ProcessPoolExecutor(
+                    max_workers=len(ranges),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    texts = [
+                        text
+                        for chunk in executor.map(_extract_page_range, ranges)
+                        for text in chunk
+                    ]
+            except (BrokenProcessPool, OSError) as e:
+                print(f"Parallel PDF extraction failed, extracting serially: {str(e)}")
+                texts = [page.extract_text() for page in reader.pages]
 
-        return text
+        # Join the non-empty pages once at the end
+        return "\n\n".join(text for text in texts if text)
     except ImportError:
         print("PyPDF not installed. Please install it with: pip install pypdf")
         return ""
     except Exception as e:
         print(f"Error extracting text from PDF: {str(e)}")
         return ""
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[Optional[str]]:
+    """Extract the text of pages [start, stop) of a PDF in a worker process."""
+    from pypdf import PdfReader
+
+    path, start, stop = args
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
@@ -0,0 +1,51 @@
+"""Token counting for keeping prompts within an LLM's budget."""
+
+import functools
+import logging
+from typing import Any, List, Optional
+
+logger = logging.getLogger("seed_pitcher.tokens")
+
+# Rough size of a token in English text, used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding() -> Optional[Any]:
+    """The GPT-4o tokenizer, or None if tiktoken cannot be loaded."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_tokens(text: str, max_tokens: int) -> List[str]:
+    """Cut text into consecutive pieces of at most max_tokens tokens each."""
+    encoding = _get_encoding()
+    if encoding is None:
+        size = max_tokens * _CHARS_PER_TOKEN
+        return [text[i : i + size] for i in range(0, len(text), size)] or [text]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return [text]
+    return [
+        encoding.decode(tokens[i : i + max_tokens])
+        for i in range(0, len(tokens), max_tokens)
+    ]
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Return the longest prefix of text that fits in max_tokens tokens."""
+    return split_tokens(text, max_tokens)[0]
@@ -1,21 +1,53 @@
 """Web search utilities for finding investor information."""
 
-from typing import Dict, Any, List
+import copy
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import seed_pitcher.config as config
+from seed_pitcher.utils.cache import get_llm_cache, llm_cache_key
+from seed_pitcher.utils.tokens import truncate_tokens
+
+# Investor lookups from this process, keyed by (name, company, fund), so an
+# investor seen by several pipeline stages is only searched for once an hour
+_SEARCH_CACHE_TTL = 60 * 60  # seconds
+_search_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+_search_cache_lock = threading.Lock()
+
+# Most search-result tokens sent to the LLM when extracting investor details
+_CORPUS_MAX_TOKENS = 3000
+
+# Extraction result when the LLM's answer can't be parsed; the empty fields are
+# tuples so callers copying it with dict() can't modify the shared values
+_EMPTY_EXTRACTION = {
+    "recent_investments": (),
+    "investment_stages": (),
+    "investment_sectors": (),
+    "fund_size": "",
+    "investment_range": "",
+}
 
 
 def search_investor_info(
     name: str, company: str = "", fund: str = ""
 ) -> Dict[str, Any]:
     """Search for investor information on the web."""
+    key = (name, company, fund)
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+    if cached and time.time() - cached[0] < _SEARCH_CACHE_TTL:
+        return copy.deepcopy(cached[1])
+
     try:
         # Use Tavily if API key is available
         if config.TAVILY_API_KEY:
-            return search_with_tavily(name, company, fund)
+            info = search_with_tavily(name, company, fund)
         else:
             # Fall back to LLM-based search simulation
-            return simulate_search_results(name, company, fund)
+            info = simulate_search_results(name, company, fund)
     except Exception as e:
         print(f"Error during web search: {str(e)}")
         return {
@@ -26,6 +58,30 @@ def search_investor_info(
             "error": str(e),
         }
 
+    with _search_cache_lock:
+        _search_cache[key] = (time.time(), copy.deepcopy(info))
+    return info
+
+
+def search_investors_info(
+    investors: List[Tuple[str, str, str]], max_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Search for several investors at once, overlapping their network calls.
+
+    Takes (name, company, fund) tuples and returns one result per investor, in
+    order. At most max_concurrency lookups run at once,
+    config.LLM_MAX_CONCURRENCY by default.
+    """
+    if not investors:
+        return []
+    if max_concurrency is None:
+        max_concurrency = config.LLM_MAX_CONCURRENCY
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(investors))
+    ) as executor:
+        return list(executor.map(lambda args: search_investor_info(*args), investors))
+
 
 def search_with_tavily(name: str, company: str = "", fund: str = "") -> Dict[str, Any]:
     """Search for investor information using Tavily API."""
@@ -41,13 +97,22 @@ def search_with_tavily(name: str, company: str = "", fund: str = "") -> Dict[str
             f"{name} investor profile angel vc",
         ]
 
-        all_results = []
-        for query in queries:
+        def run_query(query):
             search_result = client.search(query=query, search_depth="advanced")
-            all_results.extend(search_result.get("results", []))
+            return search_result.get("results", [])
+
+        # The queries are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            all_results = [
+                result
+                for results in executor.map(run_query, queries)
+                for result in results
+            ]
 
         # Process results to extract structured information
-        investor_info = process_search_results(all_results, name, company, fund)
+        investor_info = process_search_results(
+            _dedupe_results(all_results), name, company, fund
+        )
         return investor_info
 
     except ImportError:
@@ -55,14 +120,31 @@ def search_with_tavily(name: str, company: str = "", fund: str = "") -> Dict[str
         return simulate_search_results(name, company, fund)
 
 
+def _dedupe_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop results repeated across queries, by URL or by identical opening text."""
+    seen_urls = set()
+    seen_content = set()
+    unique = []
+    for result in results:
+        url = result.get("url")
+        # Tavily can return "content": null; such results only dedupe by URL
+        content_key = (result.get("content") or "")[:512]
+        if (url and url in seen_urls) or (content_key and content_key in seen_content):
+            continue
+        if url:
+            seen_urls.add(url)
+        if content_key:
+            seen_content.add(content_key)
+        unique.append(result)
+    return unique
+
+
 def process_search_results(
     results: List[Dict[str, Any]], name: str, company: str, fund: str
 ) -> Dict[str, Any]:
     """Process search results to extract structured information."""
     # Combine all text into a corpus
-    corpus = ""
-    for result in results:
-        corpus += result.get("content", "") + "\n"
+    corpus = "".join((result.get("content") or "") + "\n" for result in results)
 
     # Use the configured LLM to extract structured information
     from seed_pitcher.agents.graph import create_llm
@@ -98,23 +180,25 @@ def process_search_results(
     formatted_prompt = prompt.format(
         name=name,
         company_or_fund=company_or_fund,
-        corpus=corpus[:10000],  # Limit corpus size to avoid token limits
+        corpus=truncate_tokens(corpus, _CORPUS_MAX_TOKENS),
     )
 
+    # Search results for an investor rarely change, so reuse earlier extractions
+    cache = get_llm_cache()
+    cache_key = llm_cache_key(llm, formatted_prompt)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     response = llm.invoke([formatted_prompt])
 
     try:
         parser = JsonOutputParser()
         extracted_info = parser.parse(response.content)
+        cache.set(cache_key, extracted_info)
     except Exception:
         # If parsing fails, return empty structure
-        extracted_info = {
-            "recent_investments": [],
-            "investment_stages": [],
-            "investment_sectors": [],
-            "fund_size": "",
-            "investment_range": "",
-        }
+        extracted_info = dict(_EMPTY_EXTRACTION)
 
     return extracted_info
 
@@ -123,85 +207,86 @@ def simulate_search_results(
     name: str, company: str = "", fund: str = ""
 ) -> Dict[str, Any]:
     """Simulate search results when actual search is not available."""
+    # The result only depends on the arguments and threshold; copy it so
+    # callers can't modify the cached value
+    return copy.deepcopy(
+        _simulate_search_results(name, company, fund, config.INVESTOR_THRESHOLD)
+    )
+
+
+# Sector and stage pools for simulated results; tech-focused investors only
+# draw sectors from _TECH_SECTORS
+_TECH_SECTORS = ("SaaS", "AI", "Machine Learning", "Fintech", "Healthtech", "E-commerce")
+_ALL_SECTORS = _TECH_SECTORS + (
+    "Retail",
+    "Healthcare",
+    "Finance",
+    "Education",
+    "Manufacturing",
+)
+_STAGES = ("Pre-seed", "Seed", "Series A", "Series B", "Growth")
+
+# Parts of realistic-sounding company names for simulated recent investments
+_COMPANY_PREFIXES = ("Acme", "Nova", "Quantum", "Apex", "Zenith", "Flux", "Helix", "Echo")
+_COMPANY_SUFFIXES = (
+    "AI",
+    "Tech",
+    "Labs",
+    "Systems",
+    "Networks",
+    "Health",
+    "Finance",
+    "Robotics",
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _simulate_search_results(
+    name: str, company: str, fund: str, tech_focus_threshold: float
+) -> Dict[str, Any]:
+    """Build the simulated search results for simulate_search_results."""
     # Placeholder implementation that returns simulated data
     # In a real implementation, this would be replaced with actual web search
 
-    # Sample data structures
-    tech_sectors = [
-        "SaaS",
-        "AI",
-        "Machine Learning",
-        "Fintech",
-        "Healthtech",
-        "E-commerce",
-    ]
-    non_tech_sectors = ["Retail", "Healthcare", "Finance", "Education", "Manufacturing"]
-    stages = ["Pre-seed", "Seed", "Series A", "Series B", "Growth"]
-
     # Generate simulated data based on input
     import random
-    import hashlib
+    import zlib
 
-    # Create a deterministic but seemingly random output based on input
-    seed = hashlib.md5((name + company + fund).encode()).hexdigest()
-    random.seed(seed)
+    # Create a deterministic but seemingly random output based on input, using
+    # a private generator so the global random state is left alone
+    rng = random.Random(zlib.crc32((name + company + fund).encode()))
 
     # Decide if this is a tech investor or broader focus
     is_tech_focused = (
-        random.random() < config.INVESTOR_THRESHOLD
+        rng.random() < tech_focus_threshold
     )  # 70% chance of tech focus
 
     # Select relevant sectors
-    if is_tech_focused:
-        sector_pool = tech_sectors
-    else:
-        sector_pool = tech_sectors + non_tech_sectors
+    sector_pool = _TECH_SECTORS if is_tech_focused else _ALL_SECTORS
 
-    num_sectors = random.randint(1, 4)
-    investment_sectors = random.sample(sector_pool, min(num_sectors, len(sector_pool)))
+    num_sectors = rng.randint(1, 4)
+    investment_sectors = rng.sample(sector_pool, min(num_sectors, len(sector_pool)))
 
     # Select stages
-    num_stages = random.randint(1, 3)
-    investment_stages = random.sample(stages, min(num_stages, len(stages)))
+    num_stages = rng.randint(1, 3)
+    investment_stages = rng.sample(_STAGES, min(num_stages, len(_STAGES)))
     if "Fund" in fund or "Capital" in fund or "Ventures" in fund:
         # Real funds typically have more concentrated stage focus
         investment_stages = investment_stages[:1]
 
-    # Generate some realistic-sounding company names for recent investments
-    company_prefixes = [
-        "Acme",
-        "Nova",
-        "Quantum",
-        "Apex",
-        "Zenith",
-        "Flux",
-        "Helix",
-        "Echo",
-    ]
-    company_suffixes = [
-        "AI",
-        "Tech",
-        "Labs",
-        "Systems",
-        "Networks",
-        "Health",
-        "Finance",
-        "Robotics",
-    ]
-
-    num_investments = random.randint(0, 6)
+    num_investments = rng.randint(0, 6)
     recent_investments = []
     for _ in range(num_investments):
-        company_name = random.choice(company_prefixes) + random.choice(company_suffixes)
+        company_name = rng.choice(_COMPANY_PREFIXES) + rng.choice(_COMPANY_SUFFIXES)
         recent_investments.append(company_name)
 
     return {
         "recent_investments": recent_investments,
         "investment_stages": investment_stages,
         "investment_sectors": investment_sectors,
-        "fund_size": f"${random.randint(1, 500)}M" if random.random() < 0.5 else "",
-        "investment_range": f"${random.randint(50, 500)}K - ${random.randint(1, 10)}M"
-        if random.random() < 0.5
+        "fund_size": f"${rng.randint(1, 500)}M" if rng.random() < 0.5 else "",
+        "investment_range": f"${rng.randint(50, 500)}K - ${rng.randint(1, 10)}M"
+        if rng.random() < 0.5
         else "",
         "is_simulated": True,  # Flag to indicate this is simulated data
     }
@@ -1,10 +1,18 @@
 from setuptools import setup, find_packages
 
+
+def _reqs():
+    with open("requirements.txt", encoding="utf-8") as f:
+        return [
+            line.strip() for line in f if line.strip() and not line.startswith("#")
+        ]
+
+
 setup(
     name="seed-pitcher",
     version="0.1.0",
     packages=find_packages(),
-    install_requires=[line.strip() for line in open("requirements.txt").readlines()],
+    install_requires=_reqs(),
     entry_points={
         "console_scripts": [
             "seedpitcher=seed_pitcher.main:app",
@@ -6,6 +6,9 @@ import json
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('test_investor_scoring')
 
+# Shared session so the close call reuses the extraction call's connection
+_SESSION = requests.Session()
+
 # Test the LinkedIn profile extraction and scoring
 def test_scoring():
     base_url = "http://localhost:5500"
@@ -15,7 +18,7 @@ def test_scoring():
     
     # Step 1: Extract LinkedIn profile
     logger.info(f"Extracting LinkedIn profile from {linkedin_url}")
-    extract_response = requests.post(f"{base_url}/linkedin_profile", json={"url": linkedin_url})
+    extract_response = _SESSION.post(f"{base_url}/linkedin_profile", json={"url": linkedin_url}, timeout=60)
     
     if extract_response.status_code == 200:
         profile_data = extract_response.json()
@@ -48,7 +51,7 @@ def test_scoring():
     
     # Step 3: Close the browser when done
     logger.info("Closing browser")
-    close_response = requests.post(f"{base_url}/close")
+    close_response = _SESSION.post(f"{base_url}/close", timeout=10)
     logger.info(f"Browser close response: {close_response.status_code}")
 
 if __name__ == "__main__":